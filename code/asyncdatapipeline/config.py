@@ -1,12 +1,18 @@
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 load_dotenv()
 
 
-def _get_twitter_credentials() -> dict:
-    """Factory function to create twitter credentials dictionary."""
+# Environment variables are read once per process. The _get_* factories hand each config its
+# own copy of the cached dictionaries so instances never share mutable state.
+
+
+@lru_cache(maxsize=1)
+def _load_twitter_credentials() -> dict:
+    """Read twitter credentials from the environment."""
     return {
         "username": os.getenv("TWITTER_USERNAME"),
         "email": os.getenv("TWITTER_EMAIL"),
@@ -14,8 +20,9 @@ def _get_twitter_credentials() -> dict:
     }
 
 
-def _get_postgres_info() -> dict:
-    """Factory function to create postgres credentials dictionary."""
+@lru_cache(maxsize=1)
+def _load_postgres_info() -> dict:
+    """Read postgres credentials from the environment."""
     return {
         "name": "postgres",
         "table_name": "tweets",
@@ -30,8 +37,9 @@ def _get_postgres_info() -> dict:
     }
 
 
-def _get_mongo_info() -> dict:
-    """Factory function to create mongo credentials dictionary."""
+@lru_cache(maxsize=1)
+def _load_mongo_info() -> dict:
+    """Read mongo credentials from the environment."""
     return {
         "name": "mongo",
         "collection_name": "tweets",
@@ -45,6 +53,30 @@ def _get_mongo_info() -> dict:
     }
 
 
+def _clear_env_cache() -> None:
+    """Forget cached environment values so they are re-read on next use."""
+    _load_twitter_credentials.cache_clear()
+    _load_postgres_info.cache_clear()
+    _load_mongo_info.cache_clear()
+
+
+def _get_twitter_credentials() -> dict:
+    """Factory function to create twitter credentials dictionary."""
+    return dict(_load_twitter_credentials())
+
+
+def _get_postgres_info() -> dict:
+    """Factory function to create postgres credentials dictionary."""
+    info = _load_postgres_info()
+    return {**info, "credentials": dict(info["credentials"]), "columns": list(info["columns"])}
+
+
+def _get_mongo_info() -> dict:
+    """Factory function to create mongo credentials dictionary."""
+    info = _load_mongo_info()
+    return {**info, "credentials": dict(info["credentials"])}
+
+
 @dataclass
 class PipelineConfig:
     max_concurrent_tasks: int = 10
@@ -57,23 +89,41 @@ class PipelineConfig:
     checkpoint_path: str = "checkpoints/pipeline_state.json"
     checkpoint_frequency: int = 100  # Save checkpoint every N items
 
+    # Batching: records are processed one at a time when batch_size is 1
+    batch_size: int = 1
+    batch_flush_interval_ms: float = 50.0  # Process a partial batch once its first record is this old
+
     # Multipart processing settings
     multipart_threshold: int = 1024 * 1024 * 100  # 100MB for multipart processing
     multipart_chunk_size: int = 1024 * 1024  # 1MB chunks for multipart processing
     multipart_enabled: bool = True  # Enable multipart processing by default
 
-    # Dict with username, email, password
-    twitter_credentials: dict = field(default_factory=_get_twitter_credentials)
-    postgres: dict = field(default_factory=_get_postgres_info)
-    mongo: dict = field(default_factory=_get_mongo_info)
     huggingface_token: Optional[str] = os.getenv("HUGGINGFACE_TOKEN")
 
     # Additional settings
     cookie_path: str = "cookies.json"
     max_concurrent_requests: int = 1
+    use_uvloop: bool = True  # Run on uvloop when installed (see pipeline.install_uvloop)
 
     # Security settings
     verify_ssl: bool = True  # Verify SSL certificates
     ssl_cert_path: Optional[str] = None  # Path to custom SSL certificate
     enable_payload_encryption: bool = False  # Enable additional payload encryption
     encryption_key: Optional[str] = os.getenv("ENCRYPTION_KEY")  # Key for payload encryption
+
+    # Credential dictionaries are built on first access, they can still be assigned to override them
+
+    @cached_property
+    def twitter_credentials(self) -> dict:
+        """Dict with username, email, password."""
+        return _get_twitter_credentials()
+
+    @cached_property
+    def postgres(self) -> dict:
+        """Postgres connection info and credentials."""
+        return _get_postgres_info()
+
+    @cached_property
+    def mongo(self) -> dict:
+        """MongoDB connection info and credentials."""
+        return _get_mongo_info()
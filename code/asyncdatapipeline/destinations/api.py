@@ -1,42 +1,91 @@
 """API destination implementation."""
 
+import asyncio
 from typing import Any, Dict, Optional
 
 import aiohttp
+import orjson
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.destinations.base import Destination
 
 
 class ApiDestination(Destination):
-    """API destination for sending data to web endpoints."""
+    """API destination for sending data to web endpoints.
+
+    A single HTTP session with a pooled, keep-alive connector is shared by all sends and
+    released by close().
+    """
 
     def __init__(
         self,
         url: str,
         monitor: PipelineMonitor,
         headers: Optional[Dict[str, str]] = None,
-        method: str = "POST"
+        method: str = "POST",
+        max_concurrent_requests: int = 10,
+        timeout: float = 30.0,
     ):
+        """
+        Initialize the API destination.
+
+        Args:
+            url: Endpoint the data is sent to.
+            monitor: PipelineMonitor instance for logging and metrics.
+            headers: Extra HTTP headers sent with every request.
+            method: HTTP method, POST or PUT.
+            max_concurrent_requests: Maximum number of open connections to the endpoint.
+            timeout: Total timeout per request in seconds.
+        """
         super().__init__(monitor)
         self.url = url
         self.headers = headers or {}
         self.method = method.upper()
+        # Bodies are serialized with orjson, so the JSON content type is set here instead of by aiohttp
+        self._request_headers = {"Content-Type": "application/json", **self.headers}
+        self.max_concurrent_requests = max_concurrent_requests
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    connector = aiohttp.TCPConnector(
+                        limit=self.max_concurrent_requests,
+                        ttl_dns_cache=300,
+                        keepalive_timeout=60,
+                    )
+                    self._session = aiohttp.ClientSession(
+                        connector=connector,
+                        timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    )
+        return self._session
 
     async def send(self, data: Any) -> None:
         """Send data to API endpoint asynchronously."""
         try:
-            async with aiohttp.ClientSession() as session:
-                if self.method == "POST":
-                    async with session.post(self.url, json={"data": data}, headers=self.headers) as resp:
-                        if resp.status >= 400:
-                            raise ValueError(f"API error: {resp.status}")
-                        self.monitor.log_debug(f"Sent data to {self.url}, status: {resp.status}")
-                elif self.method == "PUT":
-                    async with session.put(self.url, json={"data": data}, headers=self.headers) as resp:
-                        if resp.status >= 400:
-                            raise ValueError(f"API error: {resp.status}")
-                        self.monitor.log_debug(f"Sent data to {self.url}, status: {resp.status}")
+            session = await self._get_session()
+            body = orjson.dumps({"data": data})
+            if self.method == "POST":
+                async with session.post(self.url, data=body, headers=self._request_headers) as resp:
+                    if resp.status >= 400:
+                        raise ValueError(f"API error: {resp.status}")
+                    self.monitor.log_debug(f"Sent data to {self.url}, status: {resp.status}")
+            elif self.method == "PUT":
+                async with session.put(self.url, data=body, headers=self._request_headers) as resp:
+                    if resp.status >= 400:
+                        raise ValueError(f"API error: {resp.status}")
+                    self.monitor.log_debug(f"Sent data to {self.url}, status: {resp.status}")
         except Exception as e:
             self.monitor.log_error(f"Error sending data to API {self.url}: {e}")
             raise
+
+    async def close(self) -> None:
+        """Close the shared HTTP session."""
+        async with self._session_lock:
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
@@ -1,7 +1,7 @@
 """Base class for all data destinations."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Awaitable
+from typing import Any, Callable, Awaitable, List
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 
@@ -23,6 +23,22 @@ class Destination(ABC):
         """Send data to the destination asynchronously."""
         pass
 
+    async def send_batch(self, items: List[dict]) -> None:
+        """Send a batch of data to the destination asynchronously.
+
+        The default sends each item in turn. Subclasses override this to write the batch in one operation.
+        """
+        for item in items:
+            await self.send(item)
+
+    async def flush(self) -> None:
+        """Write out any buffered data. Unbuffered destinations have nothing to do."""
+        pass
+
+    async def close(self) -> None:
+        """Flush buffered data and release resources held by the destination."""
+        await self.flush()
+
     async def __call__(self, data: Any) -> None:
         """Make the destination callable for pipeline compatibility."""
         try:
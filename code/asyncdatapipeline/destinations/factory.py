@@ -37,6 +37,10 @@ def file_destination(
     async def wrapper(data: Any) -> None:
         await destination(data)
 
+    # Expose batch sends and the lifecycle hooks so the pipeline can use them directly
+    wrapper.send_batch = destination.send_batch
+    wrapper.flush = destination.flush
+    wrapper.close = destination.close
     return wrapper
 
 
@@ -57,6 +61,10 @@ def sql_destination(
     async def wrapper(data: Any) -> None:
         await destination(data)
 
+    # Expose batch sends and the lifecycle hooks so the pipeline can use them directly
+    wrapper.send_batch = destination.send_batch
+    wrapper.flush = destination.flush
+    wrapper.close = destination.close
     return wrapper
 
 
@@ -76,4 +84,8 @@ def no_sql_destination(
     async def wrapper(data: Any) -> None:
         await destination(data)
 
+    # Expose batch sends and the lifecycle hooks so the pipeline can use them directly
+    wrapper.send_batch = destination.send_batch
+    wrapper.flush = destination.flush
+    wrapper.close = destination.close
     return wrapper
@@ -1,79 +1,180 @@
 """File destination implementation for async data pipeline."""
 
+import asyncio
+import codecs
+import csv
+import io
 import os
-from typing import Any
+from typing import Any, List, Optional, Sequence
 
 import aiofiles
+import orjson
+from aiofiles.threadpool.binary import AsyncBufferedIOBase
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.destinations.base import Destination
-from aiocsv import AsyncWriter
-import json
 
 
 class FileDestination(Destination):
-    """File destination for writing data to local files."""
+    """File destination for writing data to local files.
+
+    Records are formatted into an in-memory buffer and appended to a single open file handle
+    once the buffer reaches max_buffer_bytes. Call flush() or close() to write out the rest.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        monitor: PipelineMonitor,
+        encoding: str = "utf-8",
+        max_buffer_bytes: int = 64 * 1024,
+    ):
+        """
+        Initialize the file destination.
 
-    def __init__(self, file_path: str, monitor: PipelineMonitor, encoding: str = "utf-8"):
+        Args:
+            file_path: Path to the output file.
+            monitor: PipelineMonitor instance for logging and metrics.
+            encoding: File encoding (default: utf-8).
+            max_buffer_bytes: Buffered bytes that trigger a write to the file (default: 64 KiB).
+        """
         super().__init__(monitor)
         self._file_path = file_path
         self._encoding = encoding
+        self._max_buffer_bytes = max_buffer_bytes
+        self._buffer = bytearray()
+        self._file: Optional[AsyncBufferedIOBase] = None
+        self._lock = asyncio.Lock()
+        self._utf8 = codecs.lookup(encoding).name == "utf-8"
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self._file_path), exist_ok=True)
+        directory = os.path.dirname(self._file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _format(self, data: dict) -> str:
+        """Format a record as a line of text."""
+        return ",".join(map(str, data.values())) + "\n"
+
+    def _encode(self, data: dict) -> bytes:
+        """Encode a record as bytes in the file encoding."""
+        return self._format(data).encode(self._encoding)
 
     async def send(self, data: dict) -> None:
-        """Write data to file asynchronously."""
+        """Buffer data and write it to file once the buffer is full."""
         try:
-            async with aiofiles.open(self._file_path, mode="a", encoding=self._encoding) as f:
-                await f.write(",".join(map(str, data.values())) + "\n")
+            await self._buffer_and_flush(self._encode(data))
         except Exception as e:
             self.monitor.log_error(f"Error writing to file {self._file_path}: {e}")
             raise
 
-
-class CSVFileDestination(FileDestination):
-    """CSV file destination for writing data to CSV files."""
-
-    def __init__(self, file_path: str, monitor: PipelineMonitor, encoding: str = "utf-8"):
-        super().__init__(file_path, monitor, encoding)
-
-    async def send(self, data: dict) -> None:
-        """Write data to CSV file asynchronously."""
+    async def send_batch(self, items: List[dict]) -> None:
+        """Buffer a batch of data and write it to file once the buffer is full."""
         try:
-            async with aiofiles.open(self._file_path, mode="a", encoding=self._encoding) as f:
-                writer = AsyncWriter(f)
-                await writer.writerow(data.values())
+            encode = self._encode
+            await self._buffer_and_flush(b"".join([encode(item) for item in items]))
         except Exception as e:
             self.monitor.log_error(f"Error writing to file {self._file_path}: {e}")
             raise
 
+    async def _buffer_and_flush(self, encoded: bytes) -> None:
+        """Append encoded records to the buffer and flush it once it is full."""
+        start = len(self._buffer)
+        self._buffer += encoded
+        if len(self._buffer) < self._max_buffer_bytes:
+            return
+        try:
+            await self.flush()
+        except Exception:
+            # A failed flush keeps the buffer; drop only these records so a retried send adds them once
+            del self._buffer[start:start + len(encoded)]
+            raise
+
+    async def flush(self) -> None:
+        """Write buffered data to file."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            # Copy the buffer before awaiting; records sent meanwhile are appended after it
+            chunk = bytes(self._buffer)
+            if self._file is None:
+                self._file = await aiofiles.open(self._file_path, mode="ab")
+            await self._file.write(chunk)
+            await self._file.flush()
+            # Drop the written bytes only once the write succeeded, so a failure loses nothing
+            del self._buffer[:len(chunk)]
+
+    async def close(self) -> None:
+        """Flush buffered data and close the file."""
+        await self.flush()
+        async with self._lock:
+            if self._file is not None:
+                await self._file.close()
+                self._file = None
 
-class JSONFileDestination(FileDestination):
-    """JSON file destination for writing data as JSON lines asynchronously."""
 
-    def __init__(self, file_path: str, monitor: PipelineMonitor, encoding: str = "utf-8"):
+class CSVFileDestination(FileDestination):
+    """CSV file destination for writing data to CSV files.
+
+    Rows are joined with str.join; the csv module is only used for rows with values that need quoting.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        monitor: PipelineMonitor,
+        encoding: str = "utf-8",
+        max_buffer_bytes: int = 64 * 1024,
+        fieldnames: Optional[Sequence[str]] = None,
+    ):
         """
-        Initialize the JSON file destination.
+        Initialize the CSV file destination.
 
         Args:
-            file_path: Path to the output JSON file.
+            file_path: Path to the output CSV file.
             monitor: PipelineMonitor instance for logging and metrics.
             encoding: File encoding (default: utf-8).
+            max_buffer_bytes: Buffered bytes that trigger a write to the file (default: 64 KiB).
+            fieldnames: Column order of the written rows. If None, each record's own key order is used.
         """
-        self.file_path = file_path
-        self.monitor = monitor
-        self.encoding = encoding
+        super().__init__(file_path, monitor, encoding, max_buffer_bytes)
+        self._fieldnames = tuple(fieldnames) if fieldnames is not None else None
+        self._row = io.StringIO()
+        self._writer = csv.writer(self._row)
+
+    def _format(self, data: dict) -> str:
+        """Format a record as a CSV row."""
+        if self._fieldnames is not None:
+            values = [data[name] for name in self._fieldnames]
+        else:
+            values = list(data.values())
+        line = ",".join(["" if value is None else str(value) for value in values])
+        # Extra delimiters, quotes or line breaks mean some value needs quoting; an empty line is
+        # left to the csv module too, which quotes a lone empty field so it doesn't read back as no record
+        if not line or line.count(",") != len(values) - 1 or '"' in line or "\n" in line or "\r" in line:
+            return self._format_quoted(values)
+        return line + "\r\n"
+
+    def _format_quoted(self, values: list) -> str:
+        """Format a row with the csv module's quoting rules."""
+        self._row.seek(0)
+        self._row.truncate()
+        self._writer.writerow(values)
+        return self._row.getvalue()
 
-    async def send(self, data: Any) -> None:
-        """Write data as individual JSON objects to file.
+
+class JSONFileDestination(FileDestination):
+    """JSON file destination for writing data as JSON lines asynchronously."""
+
+    def _format(self, data: Any) -> str:
+        """Format data as a JSON Lines record.
 
         Args:
             data: Data to write (expected to be serializable to JSON, e.g., dict).
         """
-        try:
-            json_data = json.dumps(data, ensure_ascii=False)
-            async with aiofiles.open(self.file_path, mode="a", encoding=self.encoding) as f:
-                await f.write(json_data + "\n")  # Write as JSON Lines format
-        except Exception as e:
-            self.monitor.log_error(f"Error writing JSON to {self.file_path}: {e}")
-            raise
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE).decode()
+
+    def _encode(self, data: Any) -> bytes:
+        """Encode data as a JSON Lines record, using orjson's UTF-8 output directly when possible."""
+        if self._utf8:
+            return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+        return super()._encode(data)
@@ -53,3 +53,18 @@ class MongoDBDestination(NoSQLDB):
         except Exception as e:
             self.monitor.log_error(f"Error writing to MongoDB: {e}")
             raise
+
+    async def send_batch(self, items: list) -> None:
+        """Write a batch of data to MongoDB database with a single insert_many."""
+        if not items:
+            return
+        try:
+            if not self._db:
+                await self.connect()
+            db = self._db.get_database(self._credentials["database"])
+            collection = db.get_collection(self._db_config["collection_name"])
+            await collection.insert_many(items)
+            self.monitor.log_debug(f"Wrote {len(items)} documents to {self._db_config['collection_name']} collection")
+        except Exception as e:
+            self.monitor.log_error(f"Error writing to MongoDB: {e}")
+            raise
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncpg
 import dateutil.parser
@@ -32,6 +32,16 @@ class PostgreSQLDestination(SQLDB):
             raise
         return connection
 
+    def _prepare_row(self, data: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Convert a record into a row of column values with database types."""
+        if isinstance(data['timestamp'], str):
+            data['timestamp'] = dateutil.parser.parse(data['timestamp']).replace(tzinfo=None)
+        if isinstance(data['created_at'], str):
+            data['created_at'] = dateutil.parser.parse(data['created_at']).replace(tzinfo=None)
+        data['retweets'] = int(data['retweets'])
+        data['likes'] = int(data['likes'])
+        return tuple(data[col] for col in self.columns)
+
     async def send(self, data: Dict[str, Any]) -> None:
         """Write data to PostgreSQL database asynchronously."""
         connection: asyncpg.Connection = None
@@ -39,16 +49,10 @@ class PostgreSQLDestination(SQLDB):
             if not connection:
                 connection = await self.connect()
             if self.table_name and self.columns:
-                if isinstance(data['timestamp'], str):
-                    data['timestamp'] = dateutil.parser.parse(data['timestamp']).replace(tzinfo=None)
-                if isinstance(data['created_at'], str):
-                    data['created_at'] = dateutil.parser.parse(data['created_at']).replace(tzinfo=None)
-                data['retweets'] = int(data['retweets'])
-                data['likes'] = int(data['likes'])
                 columns = ", ".join(self.columns)
                 values = ", ".join([f"${i + 1}" for i in range(len(self.columns))])
                 query = f"INSERT INTO {self.table_name} ({columns}) VALUES ({values})"
-                await connection.execute(query, *[data[col] for col in self.columns])
+                await connection.execute(query, *self._prepare_row(data))
             else:
                 raise ValueError("Table name or columns not specified")
             self.monitor.log_debug(f"Wrote data to {self.table_name} table")
@@ -58,3 +62,22 @@ class PostgreSQLDestination(SQLDB):
         except Exception as e:
             self.monitor.log_error(f"Error writing to PostgreSQL database: {e}")
             raise
+
+    async def send_batch(self, items: List[Dict[str, Any]]) -> None:
+        """Write a batch of data to PostgreSQL database with a single COPY."""
+        if not items:
+            return
+        if not (self.table_name and self.columns):
+            self.monitor.log_error("Value error: Table name or columns not specified")
+            raise ValueError("Table name or columns not specified")
+        try:
+            records = [self._prepare_row(data) for data in items]
+            connection = await self.connect()
+            try:
+                await connection.copy_records_to_table(self.table_name, records=records, columns=self.columns)
+            finally:
+                await connection.close()
+            self.monitor.log_debug(f"Wrote {len(records)} rows to {self.table_name} table")
+        except Exception as e:
+            self.monitor.log_error(f"Error writing to PostgreSQL database: {e}")
+            raise
@@ -1,7 +1,7 @@
-from datetime import datetime
+from collections import deque
 import logging
 from typing import Dict, Any
-from time import time
+from time import perf_counter_ns
 
 
 class LoggingFormatter(logging.Formatter):
@@ -23,22 +23,57 @@ class LoggingFormatter(logging.Formatter):
         "CRITICAL": "\033[48;5;196;38;5;231m",
     }
 
+    # Colored level names are built once instead of for every record
+    COLORED_LEVELNAMES = {name: f"{color}{name}\033[0m" for name, color in LEVEL_COLORS.items()}
+
     def format(self, record: logging.LogRecord) -> str:
         """Config format"""
         levelname = record.levelname
-        level_color = self.LEVEL_COLORS.get(levelname, "")
-        record.levelname = f"{level_color}{levelname}\033[0m"
-        record.asctime = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S.%f")
-        return super().format(record)
+        record.levelname = self.COLORED_LEVELNAMES.get(levelname) or f"{levelname}\033[0m"
+        try:
+            return super().format(record)
+        finally:
+            # Other handlers format the same record, so don't leak the colors to them
+            record.levelname = levelname
+
+
+# Formatters are stateless, so every monitor's handlers share the same instances
+_DEFAULT_FORMATTER = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] [%(name)s] "
+    "[%(funcName)s():%(lineno)s] [PID:%(process)d TID:%(thread)d] %(message)s",
+    "%d/%m/%Y %H:%M:%S",
+)
+_CONSOLE_FORMATTER = LoggingFormatter(LoggingFormatter.FORMAT)
 
 
 class PipelineMonitor:
-    """Observer for tracking pipeline metrics and logging events."""
+    """Observer for tracking pipeline metrics and logging events.
+
+    Latency is aggregated as a running sum and count, so memory use and get_metrics() stay
+    constant however many items are processed; metrics["latency"] keeps only the most recent
+    LATENCY_WINDOW_SIZE samples. Latencies are kept as integer nanoseconds and only converted to
+    seconds by get_metrics().
+    """
+
+    LATENCY_WINDOW_SIZE = 1024
+
+    # Start times passed to track_processing come from this clock
+    now_ns = staticmethod(perf_counter_ns)
 
     def __init__(self) -> None:
-        self.metrics: Dict[str, Any] = {"throughput": 0, "latency": [], "errors": 0}
+        self._init_metrics()
         self.logger = self.configure_logging("logger.log")
 
+    def _init_metrics(self) -> None:
+        """Reset the metrics and the running latency totals."""
+        self.metrics: Dict[str, Any] = {
+            "throughput": 0,
+            "latency": deque(maxlen=self.LATENCY_WINDOW_SIZE),
+            "errors": 0,
+        }
+        self._latency_sum_ns = 0
+        self._latency_count = 0
+
     def configure_logging(self, file_name: str, LOGGING_LEVEL: int = logging.INFO) -> logging.Logger:
         logger = logging.getLogger()
         logger.setLevel(LOGGING_LEVEL)
@@ -49,17 +84,14 @@ class PipelineMonitor:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(LOGGING_LEVEL)
 
-        # Create a formatter and add it to the handlers
-        default_formatter = logging.Formatter(
-            "[%(asctime)s] [%(levelname)s] [%(name)s] "
-            "[%(funcName)s():%(lineno)s] [PID:%(process)d TID:%(thread)d] %(message)s",
-            "%d/%m/%Y %H:%M:%S",
-        )
-
-        file_handler.setFormatter(default_formatter)
-        console_handler.setFormatter(LoggingFormatter(LoggingFormatter.FORMAT))
+        # Add the shared formatters to the handlers
+        file_handler.setFormatter(_DEFAULT_FORMATTER)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
 
         if logger.hasHandlers():
+            # Close replaced handlers so their files aren't leaked
+            for handler in logger.handlers:
+                handler.close()
             logger.handlers.clear()
 
         logger.addHandler(console_handler)
@@ -67,24 +99,68 @@ class PipelineMonitor:
 
         return logger
 
-    def log_debug(self, message: str) -> None:
-        self.logger.debug(message)
+    def is_debug_enabled(self) -> bool:
+        """Whether debug messages would be emitted, so callers can skip building them."""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    # Messages may use %-style args, which logging only formats for records that are emitted
 
-    def log_event(self, message: str) -> None:
-        self.logger.info(message)
+    def log_debug(self, message: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(message, *args)
 
-    def log_warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def log_event(self, message: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(message, *args)
 
-    def log_error(self, message: str) -> None:
-        self.logger.error(message)
+    def log_warning(self, message: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(message, *args)
+
+    def log_error(self, message: str, *args: Any, exc_info: Any = None) -> None:
+        """Log an error, with the traceback of exc_info formatted only if a handler emits the record."""
+        self.logger.error(message, *args, exc_info=exc_info)
         self.metrics["errors"] += 1
 
-    def track_processing(self, start_time: float) -> None:
-        latency = time() - start_time
+    def track_processing(self, start_ns: int) -> None:
+        """Record one processed item, given its start time from now_ns()."""
+        latency_ns = perf_counter_ns() - start_ns
         self.metrics["throughput"] += 1
-        self.metrics["latency"].append(latency)
+        self.metrics["latency"].append(latency_ns)
+        self._latency_sum_ns += latency_ns
+        self._latency_count += 1
 
     def get_metrics(self) -> Dict[str, Any]:
-        avg_latency = sum(self.metrics["latency"]) / len(self.metrics["latency"]) if self.metrics["latency"] else 0
+        avg_latency = self._latency_sum_ns / self._latency_count / 1e9 if self._latency_count else 0
         return {"throughput": self.metrics["throughput"], "avg_latency": avg_latency, "errors": self.metrics["errors"]}
+
+
+class NullMonitor(PipelineMonitor):
+    """Monitor that discards log messages and latency timings.
+
+    It configures no logging handlers, so it suits tests and benchmarks, and runs where
+    monitoring is disabled. Processed items are still counted in metrics["throughput"],
+    which the pipeline uses to decide when to save checkpoints.
+    """
+
+    def __init__(self) -> None:
+        self._init_metrics()
+        self.logger = logging.getLogger(__name__)
+
+    def is_debug_enabled(self) -> bool:
+        return False
+
+    def log_debug(self, message: str, *args: Any) -> None:
+        pass
+
+    def log_event(self, message: str, *args: Any) -> None:
+        pass
+
+    def log_warning(self, message: str, *args: Any) -> None:
+        pass
+
+    def log_error(self, message: str, *args: Any, exc_info: Any = None) -> None:
+        pass
+
+    def track_processing(self, start_ns: int) -> None:
+        self.metrics["throughput"] += 1
@@ -3,19 +3,26 @@ import json
 import os
 import ssl
 from contextlib import asynccontextmanager
-from time import time
+from time import monotonic
 from typing import (
     Any,
     AsyncGenerator,
     Callable,
     Coroutine,
     List,
+    Tuple,
     Optional,
     Set,
     TypeVar,
 )
 
 import aiohttp
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from asyncdatapipeline.config import PipelineConfig
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.security import DataEncryptor
@@ -25,6 +32,27 @@ SourceType = Callable[[], Any | asyncio.Future]
 TransformerType = Callable[[Any], Any]
 DestinationType = Callable[[Any], Coroutine[Any, Any, None]]
 
+# Marks the end of a source in the batching queue
+_END_OF_SOURCE = object()
+
+
+def install_uvloop(config: Optional[PipelineConfig] = None) -> bool:
+    """
+    Use uvloop for event loops created from now on.
+
+    A running loop cannot be replaced, so call this before asyncio.run().
+
+    Args:
+        config: Pipeline configuration; nothing is installed when its use_uvloop is False.
+
+    Returns:
+        Whether uvloop was installed.
+    """
+    if uvloop is None or (config is not None and not config.use_uvloop):
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
 
 class AsyncDataPipeline:
     """Asynchronous data pipeline for large-scale data processing with Twitter/X stream support."""
@@ -90,11 +118,47 @@ class AsyncDataPipeline:
             finally:
                 self.session = None
 
+    async def _flush_destinations(self, close: bool = False) -> bool:
+        """Flush buffered destination data, optionally closing the destinations.
+
+        Returns:
+            bool: True if every destination was flushed, False if any of them failed.
+        """
+        flushed = True
+        for dest in self.destinations:
+            hook = getattr(dest, "close" if close else "flush", None)
+            if hook is None:
+                continue
+            try:
+                await hook()
+            except Exception as e:
+                flushed = False
+                self.monitor.log_error(f"Failed to flush destination {getattr(dest, '__name__', str(dest))}: {e}")
+        return flushed
+
+    async def _close_transformers(self) -> None:
+        """Release background tasks and threads held by transformers."""
+        for transformer in self.transformers:
+            close = getattr(transformer, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                self.monitor.log_error(
+                    f"Failed to close transformer {getattr(transformer, '__name__', str(transformer))}: {e}"
+                )
+
     async def _save_checkpoint(self) -> None:
         """Save processing state to enable recovery if interrupted."""
         if not self.checkpoint_path:
             return
 
+        # Items are marked as processed once dispatched, so write out buffered output first
+        if not await self._flush_destinations():
+            self.monitor.log_error("Skipping checkpoint because buffered output could not be written")
+            return
+
         try:
             checkpoint_dir = os.path.dirname(self.checkpoint_path)
             if not os.path.exists(checkpoint_dir):
@@ -152,34 +216,163 @@ class AsyncDataPipeline:
                         self.monitor.log_error(f"Source failed after {self.config.retry_attempts} attempts")
                         raise
 
+            if self.config.batch_size > 1:
+                await self._process_source_batched(source_generator)
+                return
+
+            # Snapshot settings and bound methods used for every record into locals
+            enable_recovery = self.config.enable_recovery
+            checkpoint_frequency = self.config.checkpoint_frequency
+            processed_ids = self.processed_ids
+            monitor = self.monitor
+            metrics = monitor.metrics
+            now_ns = monitor.now_ns
+            track_processing = monitor.track_processing
+            apply_transformers = self._apply_transformers
+            dispatch_to_destinations = self._dispatch_to_destinations
+
             # Process source data
             async for data in source_generator:
                 # Generate a consistent ID for the data item
                 data_id = str(hash(str(data)))
 
                 # Skip already processed items if in recovery mode
-                if data_id in self.processed_ids and self.config.enable_recovery:
-                    self.monitor.log_debug(f"Skipping already processed item {data_id}")
+                if enable_recovery and data_id in processed_ids:
+                    monitor.log_debug(f"Skipping already processed item {data_id}")
                     continue
 
-                start_time = time()
-                processed_data = await self._apply_transformers(data)
+                start_ns = now_ns()
+                processed_data = await apply_transformers(data)
 
                 if processed_data is not None:  # Skip None from filters
-                    await self._dispatch_to_destinations(processed_data)
+                    await dispatch_to_destinations(processed_data)
                     # Mark as processed after successful processing
-                    self.processed_ids.add(data_id)
+                    processed_ids.add(data_id)
 
                     # Save checkpoint periodically based on config setting
-                    if (self.monitor.get_metrics()["throughput"] % self.config.checkpoint_frequency) == 0:
+                    if metrics["throughput"] % checkpoint_frequency == 0:
                         await self._save_checkpoint()
 
-                self.monitor.track_processing(start_time)
+                track_processing(start_ns)
         except Exception as e:
             self.monitor.log_error(f"Error processing source: {e}")
             # Try to save checkpoint on error to preserve progress
             await self._save_checkpoint()
 
+    async def _process_source_batched(self, source_generator: AsyncGenerator[Any, None]) -> None:
+        """Collect source data into batches and process them batch by batch."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.batch_size * 2)
+
+        async def collect() -> None:
+            try:
+                async for data in source_generator:
+                    await queue.put(data)
+            except Exception:
+                await queue.put(_END_OF_SOURCE)
+                raise
+            await queue.put(_END_OF_SOURCE)
+
+        collector = asyncio.create_task(collect())
+        try:
+            async for batch in self._iter_batches(queue):
+                await self._process_batch(batch)
+            # Surface errors raised by the source
+            await collector
+        finally:
+            collector.cancel()
+
+    async def _iter_batches(self, queue: asyncio.Queue) -> AsyncGenerator[List[Any], None]:
+        """Yield batches of batch_size items, or fewer once the oldest item has waited for the flush interval."""
+        batch_size = self.config.batch_size
+        flush_interval = self.config.batch_flush_interval_ms / 1000
+        while True:
+            item = await queue.get()
+            if item is _END_OF_SOURCE:
+                return
+            batch = [item]
+            deadline = monotonic() + flush_interval
+            while len(batch) < batch_size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _END_OF_SOURCE:
+                    yield batch
+                    return
+                batch.append(item)
+            yield batch
+
+    async def _process_batch(self, batch: List[Any]) -> None:
+        """Apply transformations to a batch and dispatch the results to destinations."""
+        enable_recovery = self.config.enable_recovery
+        processed_ids = self.processed_ids
+        pending: List[Tuple[str, Any]] = []
+        for data in batch:
+            data_id = str(hash(str(data)))
+            # Skip already processed items if in recovery mode
+            if enable_recovery and data_id in processed_ids:
+                self.monitor.log_debug(f"Skipping already processed item {data_id}")
+                continue
+            pending.append((data_id, data))
+        if not pending:
+            return
+
+        start_ns = self.monitor.now_ns()
+        results = await self._apply_transformers_batch([data for _, data in pending])
+
+        processed = [(data_id, result) for (data_id, _), result in zip(pending, results) if result is not None]
+        if processed:
+            await self._dispatch_batch_to_destinations([result for _, result in processed])
+            # Mark as processed after successful processing
+            self.processed_ids.update(data_id for data_id, _ in processed)
+
+        checkpoint_frequency = self.config.checkpoint_frequency
+        metrics = self.monitor.metrics
+        track_processing = self.monitor.track_processing
+        checkpoints_before = metrics["throughput"] // checkpoint_frequency
+        for _ in pending:
+            track_processing(start_ns)
+        # Save checkpoint whenever the batch crosses a multiple of the checkpoint frequency
+        if metrics["throughput"] // checkpoint_frequency != checkpoints_before:
+            await self._save_checkpoint()
+
+    async def _apply_transformers_batch(self, items: List[Any]) -> List[Any]:
+        """Apply transformers to a batch, returning one result per item with None for filtered items.
+
+        Transformers with a transform_batch method get the whole batch, others are applied item by item.
+        """
+        results: List[Any] = list(items)
+        # Positions in results of the items that have not been filtered out
+        alive = list(range(len(items)))
+        for transformer in self.transformers:
+            transformer_name = getattr(transformer, "__name__", str(transformer))
+            component_name = f"Transformer {transformer_name}"
+            current = [results[i] for i in alive]
+            try:
+                transform_batch = getattr(transformer, "transform_batch", None)
+                if transform_batch is not None:
+                    transformed = await self._apply_with_retry(transform_batch, current, component_name)
+                else:
+                    transformed = [
+                        await self._apply_with_retry(transformer, item, component_name) for item in current
+                    ]
+            except Exception as e:
+                self.monitor.log_error(f"Error in transformer {transformer_name}: {e}")
+                raise
+
+            for i, result in zip(alive, transformed):
+                results[i] = result
+            alive = [i for i in alive if results[i] is not None]
+            if not alive:  # Everything was filtered out
+                break
+        return results
+
     async def _apply_transformers(self, data: Any) -> Any:
         """Apply transformers sequentially with support for async transformers."""
         result = data
@@ -202,10 +395,11 @@ class AsyncDataPipeline:
 
     async def _apply_with_retry(self, transformer: TransformerType, data: Any, component_name: str) -> Any:
         """Apply a function with retry logic."""
+        retry_attempts = self.config.retry_attempts
         attempts = 0
         last_exception = None
 
-        while attempts < self.config.retry_attempts:
+        while attempts < retry_attempts:
             attempts += 1
             try:
                 # Apply transformer, supporting both async and non-async transformer functions
@@ -216,14 +410,14 @@ class AsyncDataPipeline:
             except Exception as e:
                 last_exception = e
                 self.monitor.log_warning(
-                    f"{component_name} failed (attempt {attempts}/{self.config.retry_attempts}): {e}"
+                    f"{component_name} failed (attempt {attempts}/{retry_attempts}): {e}"
                 )
-                if attempts < self.config.retry_attempts:
+                if attempts < retry_attempts:
                     self.monitor.log_debug(f"Retrying in {self.config.retry_delay} seconds...")
                     await asyncio.sleep(self.config.retry_delay)
 
         # If we get here, all retry attempts failed
-        self.monitor.log_error(f"{component_name} failed after {self.config.retry_attempts} attempts")
+        self.monitor.log_error(f"{component_name} failed after {retry_attempts} attempts")
         raise last_exception
 
     async def _dispatch_to_destinations(self, data: Any) -> None:
@@ -244,6 +438,25 @@ class AsyncDataPipeline:
         tasks = [try_destination(dest, data) for dest in self.destinations]
         await asyncio.gather(*tasks, return_exceptions=True)
 
+    async def _dispatch_batch_to_destinations(self, items: List[Any]) -> None:
+        """Dispatch a batch to destinations, using their send_batch method when they have one."""
+        # Apply encryption if enabled
+        if self.encryptor and self.config.enable_payload_encryption:
+            items = [self.encryptor.encrypt(data) for data in items]
+
+        async def try_destination(dest: DestinationType) -> None:
+            component_name = f"Destination {getattr(dest, '__name__', str(dest))}"
+            async with self.semaphore:
+                send_batch = getattr(dest, "send_batch", None)
+                if send_batch is not None:
+                    await self._apply_with_retry(send_batch, items, component_name)
+                    return
+                for data in items:
+                    await self._apply_with_retry(lambda d: dest(d), data, component_name)
+
+        tasks = [try_destination(dest) for dest in self.destinations]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def run(self) -> None:
         """Run the pipeline: collect, transform, and dispatch data."""
         # Load checkpoint for recovery if enabled
@@ -257,4 +470,6 @@ class AsyncDataPipeline:
             finally:
                 # Always save checkpoint at the end
                 await self._save_checkpoint()
+                await self._flush_destinations(close=True)
+                await self._close_transformers()
                 self.monitor.log_event(f"Pipeline completed. Metrics: {self.monitor.get_metrics()}")
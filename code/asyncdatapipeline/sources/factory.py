@@ -42,6 +42,10 @@ def file_source(file_path: str, monitor: PipelineMonitor, **kwargs) -> Any:
             parquet_params["use_threads"] = kwargs_copy.pop("use_threads")
         if "filters" in kwargs_copy:
             parquet_params["filters"] = kwargs_copy.pop("filters")
+        if "use_processes" in kwargs_copy:
+            parquet_params["use_processes"] = kwargs_copy.pop("use_processes")
+        if "max_workers" in kwargs_copy:
+            parquet_params["max_workers"] = kwargs_copy.pop("max_workers")
         return ParquetFileSource(**parquet_params)
 
     # For all other file types, include multipart parameters
@@ -57,6 +61,8 @@ def file_source(file_path: str, monitor: PipelineMonitor, **kwargs) -> Any:
             csv_params["delimiter"] = kwargs_copy.pop("delimiter")
         if "has_header" in kwargs_copy:
             csv_params["has_header"] = kwargs_copy.pop("has_header")
+        if "use_arrow" in kwargs_copy:
+            csv_params["use_arrow"] = kwargs_copy.pop("use_arrow")
         return CSVFileSource(**csv_params)
 
     elif file_path.endswith(".jsonl"):
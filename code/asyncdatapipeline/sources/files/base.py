@@ -19,67 +19,83 @@ class FileSource(Source):
         monitor: PipelineMonitor,
         encoding: str = "utf-8",
         multipart_enabled: bool = True,
-        chunk_size: int = 1024 * 1024  # Default 1MB chunks
+        chunk_size: int = 1024 * 1024,  # Default 1MB chunks
+        max_parallel_reads: int = 8,
     ):
         super().__init__(monitor)
         self._file_path = file_path
         self._encoding = encoding
         self._multipart_enabled = multipart_enabled
         self._chunk_size = chunk_size
+        self._max_parallel_reads = max(1, max_parallel_reads)
         self._file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
 
     async def _read_standard(self) -> AsyncGenerator[str, None]:
         """Standard line-by-line reading from file."""
+        log_debug = self.monitor.log_debug
+        debug_enabled = self.monitor.is_debug_enabled()
         async with aiofiles.open(self._file_path, mode="r", encoding=self._encoding) as file:
             async for line in file:
-                self.monitor.log_debug(f"Read line from {self._file_path}")
+                if debug_enabled:
+                    log_debug(f"Read line from {self._file_path}")
                 yield line.strip()
 
+    def _open_for_pread(self) -> int:
+        """Open the file for positional reads, hinting sequential access where supported."""
+        fd = os.open(self._file_path, os.O_RDONLY)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return fd
+
+    def _decode(self, data: bytes, chunk_idx: int) -> str:
+        """Decode complete lines read from a chunk."""
+        try:
+            return data.decode(self._encoding)
+        except UnicodeDecodeError:
+            self.monitor.log_warning(f"Decode error in chunk {chunk_idx}, replacing invalid bytes")
+            return data.decode(self._encoding, errors="replace")
+
     async def _read_multipart(self) -> AsyncGenerator[str, None]:
-        """Read file in chunks for efficient processing of large files."""
+        """Read file in chunks for efficient processing of large files.
+
+        Chunks are read with os.pread in worker threads, up to max_parallel_reads at a time. Bytes
+        after the last newline of a chunk are carried over to the next one, so lines and multi-byte
+        characters split across chunk boundaries are decoded whole.
+        """
         # Determine number of chunks
         num_chunks = max(1, (self._file_size + self._chunk_size - 1) // self._chunk_size)
-        incomplete_lines = []
-
-        for chunk_idx in range(num_chunks):
-            start_pos = chunk_idx * self._chunk_size
-            end_pos = min((chunk_idx + 1) * self._chunk_size, self._file_size)
-
-            # Read chunk
-            async with aiofiles.open(self._file_path, mode="rb") as file:
-                await file.seek(start_pos)
-                chunk_data = await file.read(end_pos - start_pos)
-
-            # Decode chunk, handling encoding issues
-            try:
-                chunk_text = chunk_data.decode(self._encoding)
-            except UnicodeDecodeError:
-                # Handle potential split multi-byte characters at chunk boundaries
-                self.monitor.log_warning(f"Decode error in chunk {chunk_idx}, adjusting boundary")
-                # Try reading a few more bytes to complete character
-                async with aiofiles.open(self._file_path, mode="rb") as file:
-                    await file.seek(start_pos)
-                    chunk_data = await file.read(end_pos - start_pos + 4)  # Read a few extra bytes
-                chunk_text = chunk_data.decode(self._encoding, errors='replace')
-
-            # Process lines in the chunk
-            lines = chunk_text.splitlines()
-
-            # If we have an incomplete line from previous chunk, prepend it
-            if incomplete_lines and chunk_idx > 0:
-                lines[0] = incomplete_lines.pop() + lines[0]
-
-            # All complete lines except the last one can be yielded
-            for line in lines[:-1]:
-                self.monitor.log_debug(f"Read line from chunk {chunk_idx} of {self._file_path}")
-                yield line
+        chunk_size = self._chunk_size
+        log_debug = self.monitor.log_debug
+        debug_enabled = self.monitor.is_debug_enabled()
+        remainder = b""
 
-            # Save the last line as it might be incomplete (unless last chunk)
-            if chunk_idx < num_chunks - 1:
-                incomplete_lines = [lines[-1]]
-            else:
-                # Last chunk, yield the final line too
-                yield lines[-1]
+        fd = self._open_for_pread()
+        try:
+            for first_chunk in range(0, num_chunks, self._max_parallel_reads):
+                chunk_indices = range(first_chunk, min(first_chunk + self._max_parallel_reads, num_chunks))
+                chunks = await asyncio.gather(
+                    *(asyncio.to_thread(os.pread, fd, chunk_size, idx * chunk_size) for idx in chunk_indices)
+                )
+
+                for chunk_idx, chunk_data in zip(chunk_indices, chunks):
+                    data = remainder + chunk_data if remainder else chunk_data
+                    # Only the bytes up to the last newline are known to hold complete lines
+                    end = data.rfind(b"\n") + 1
+                    remainder = data[end:]
+                    if not end:
+                        continue
+
+                    for line in self._decode(data[:end], chunk_idx).splitlines():
+                        if debug_enabled:
+                            log_debug(f"Read line from chunk {chunk_idx} of {self._file_path}")
+                        yield line
+        finally:
+            os.close(fd)
+
+        # The last line may not end with a newline
+        if remainder:
+            for line in self._decode(remainder, num_chunks - 1).splitlines():
+                yield line
 
     async def generate(self) -> AsyncGenerator[str, None]:
         """Generate data from file source."""
@@ -1,14 +1,36 @@
 """CSV file source implementation for async data pipeline."""
 
-from typing import AsyncGenerator, List
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+import asyncio
+import codecs
+import csv
+import io
+import itertools
+import mmap
 import os
 
 import aiofiles
-from aiocsv import AsyncReader
+import pyarrow.csv as pa_csv
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.sources.files.base import FileSource
 
+# Rows parsed per worker-thread hop when streaming files larger than chunk_size
+_ROW_BATCH_SIZE = 1000
+
+
+def _read_next_records(reader: pa_csv.CSVStreamingReader) -> Optional[List[Dict[str, Any]]]:
+    """Parse the next block of a streaming Arrow CSV reader into dict records, or None at EOF."""
+    try:
+        return reader.read_next_batch().to_pylist()
+    except StopIteration:
+        return None
+
+
+def _read_next_rows(reader: Any, count: int) -> List[List[str]]:
+    """Parse up to count rows from a csv reader, or an empty list at EOF."""
+    return list(itertools.islice(reader, count))
+
 
 class CSVFileSource(FileSource):
     """CSV file source reading large CSV files line-by-line.
@@ -21,6 +43,9 @@ class CSVFileSource(FileSource):
         has_header (bool): Whether the CSV file has a header row. Defaults to True.
         multipart_enabled (bool): Whether to use multipart processing for large files.
         chunk_size (int): Size of chunks in bytes for multipart processing.
+        use_arrow (bool): Whether to parse the file with Arrow's C++ CSV reader, one chunk_size
+            block at a time. Rows are yielded as dicts keyed by column name with inferred types
+            instead of lists of strings. Defaults to False.
     """
 
     def __init__(
@@ -31,25 +56,81 @@ class CSVFileSource(FileSource):
         delimiter: str = ",",
         has_header: bool = True,
         multipart_enabled: bool = True,
-        chunk_size: int = 1024 * 1024  # Default 1MB chunks
+        chunk_size: int = 1024 * 1024,  # Default 1MB chunks
+        use_arrow: bool = False,
     ):
         super().__init__(file_path, monitor, encoding, multipart_enabled, chunk_size)
         self.delimiter = delimiter
         self.has_header = has_header
+        self.use_arrow = use_arrow
         self._header = None
 
-    async def _read_csv_standard(self) -> AsyncGenerator[List[str], None]:
-        """Standard CSV reading approach."""
-        async with aiofiles.open(self._file_path, mode="r", encoding=self._encoding) as file:
-            reader = AsyncReader(file, delimiter=self.delimiter)
+    async def _read_csv_arrow(self) -> AsyncGenerator[Dict[str, Any], None]:
+        """Arrow CSV reading: parse blocks in C++ off the event loop and yield dict records."""
+        loop = asyncio.get_running_loop()
+        # Arrow only skips transcoding when given its own spelling of UTF-8
+        encoding = "utf8" if codecs.lookup(self._encoding).name == "utf-8" else self._encoding
+        read_options = pa_csv.ReadOptions(
+            encoding=encoding,
+            block_size=self._chunk_size,
+            autogenerate_column_names=not self.has_header,
+        )
+        parse_options = pa_csv.ParseOptions(delimiter=self.delimiter)
+        reader = await loop.run_in_executor(
+            None, lambda: pa_csv.open_csv(self._file_path, read_options=read_options, parse_options=parse_options)
+        )
+        self._header = reader.schema.names
+        self.monitor.log_debug(f"Read header from {self._file_path}: {self._header}")
+
+        log_debug = self.monitor.log_debug
+        debug_enabled = self.monitor.is_debug_enabled()
+        while (records := await loop.run_in_executor(None, _read_next_records, reader)) is not None:
+            if debug_enabled:
+                log_debug(f"Parsed {len(records)} CSV rows from {self._file_path}")
+            for record in records:
+                yield record
 
+    def _read_rows(self) -> List[List[str]]:
+        """Read and decode the whole file through a memory map and parse it."""
+        with open(self._file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                text = str(mapped, self._encoding)
+        return list(csv.reader(io.StringIO(text), delimiter=self.delimiter))
+
+    async def _iter_row_batches(self) -> AsyncGenerator[List[List[str]], None]:
+        """Yield batches of parsed rows, reading and parsing off the event loop."""
+        if self._file_size <= self._chunk_size:
+            # Files up to chunk_size are decoded and parsed in one go
+            yield await asyncio.to_thread(self._read_rows)
+            return
+
+        # Larger files stream through csv.reader so memory doesn't grow with the file
+        file = await asyncio.to_thread(open, self._file_path, "r", encoding=self._encoding, newline="")
+        try:
+            reader = csv.reader(file, delimiter=self.delimiter)
+            while rows := await asyncio.to_thread(_read_next_rows, reader, _ROW_BATCH_SIZE):
+                yield rows
+        finally:
+            file.close()
+
+    async def _read_csv_standard(self) -> AsyncGenerator[List[str], None]:
+        """Standard CSV reading approach: parse rows with csv.reader in a worker thread."""
+        skip_header = self.has_header
+        log_debug = self.monitor.log_debug
+        debug_enabled = self.monitor.is_debug_enabled()
+        async for rows in self._iter_row_batches():
             # Handle header row
-            if self.has_header:
-                self._header = await reader.__anext__()
+            if skip_header and rows:
+                skip_header = False
+                self._header = rows[0]
+                rows = rows[1:]
                 self.monitor.log_debug(f"Skipped header row from {self._file_path}")
 
-            async for row in reader:
-                self.monitor.log_debug(f"Read row from {self._file_path}")
+            for row in rows:
+                if debug_enabled:
+                    log_debug(f"Read row from {self._file_path}")
                 yield row
 
     async def _read_csv_multipart(self) -> AsyncGenerator[List[str], None]:
@@ -63,6 +144,8 @@ class CSVFileSource(FileSource):
 
         # Read the file line by line using multipart for efficiency
         first_row = True
+        log_debug = self.monitor.log_debug
+        debug_enabled = self.monitor.is_debug_enabled()
         async for line in self._read_multipart():
             # Skip the first real line if we have a header
             if first_row and self.has_header:
@@ -71,12 +154,18 @@ class CSVFileSource(FileSource):
 
             # Parse and yield the CSV row
             row = line.split(self.delimiter)
-            self.monitor.log_debug(f"Read CSV row from {self._file_path}")
+            if debug_enabled:
+                log_debug(f"Read CSV row from {self._file_path}")
             yield row
 
-    async def generate(self) -> AsyncGenerator[List[str], None]:
+    async def generate(self) -> AsyncGenerator[Union[List[str], Dict[str, Any]], None]:
         """Generate data from CSV file source."""
         try:
+            if self.use_arrow:
+                async for record in self._read_csv_arrow():
+                    yield record
+                return
+
             # Determine if multipart reading would be beneficial
             should_use_multipart = (
                 self._multipart_enabled and
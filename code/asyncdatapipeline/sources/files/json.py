@@ -38,11 +38,14 @@ class JSONFileSource(FileSource):
 
     async def _read_json_lines(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Read JSON Lines format - one JSON object per line."""
+        log_debug = self.monitor.log_debug
+        debug_enabled = self.monitor.is_debug_enabled()
         async for line in self._read_standard() if not self._multipart_enabled else self._read_multipart():
             try:
                 if line.strip():  # Skip empty lines
                     data = json.loads(line)
-                    self.monitor.log_debug(f"Parsed JSON object from {self._file_path}")
+                    if debug_enabled:
+                        log_debug(f"Parsed JSON object from {self._file_path}")
                     yield data
             except json.JSONDecodeError as e:
                 self.monitor.log_warning(f"Error parsing JSON line: {e}")
@@ -59,8 +62,11 @@ class JSONFileSource(FileSource):
 
             # If the data is an array, yield each item
             if isinstance(data, list):
+                log_debug = self.monitor.log_debug
+                debug_enabled = self.monitor.is_debug_enabled()
                 for item in data:
-                    self.monitor.log_debug(f"Yielding item from JSON array in {self._file_path}")
+                    if debug_enabled:
+                        log_debug(f"Yielding item from JSON array in {self._file_path}")
                     yield item
             else:
                 # If the data is a single object, yield it
@@ -1,26 +1,70 @@
 """Parquet file source implementation for async data pipeline."""
 
 from typing import AsyncGenerator, Dict, Any, Optional, List
+from collections import deque
 import os
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.sources.file import FileSource
 
 
+def _read_parquet_row_group(
+    parquet_file: pq.ParquetFile,
+    index: int,
+    columns: Optional[List[str]],
+    filters: Optional[List],
+    use_threads: bool,
+) -> pa.Table:
+    """Read and decode one row group of a Parquet file, applying filters if given."""
+    if not filters:
+        return parquet_file.read_row_group(index, columns=columns, use_threads=use_threads)
+    # Filters may reference columns outside the projection, so select after filtering
+    table = parquet_file.read_row_group(index, use_threads=use_threads)
+    table = table.filter(pq.filters_to_expression(filters))
+    return table.select(columns) if columns else table
+
+
+def _read_parquet_row_group_ipc(
+    file_path: str,
+    index: int,
+    columns: Optional[List[str]],
+    filters: Optional[List],
+    use_threads: bool,
+) -> bytes:
+    """Decode a Parquet row group in a worker process and return it as Arrow IPC stream bytes."""
+    table = _read_parquet_row_group(pq.ParquetFile(file_path), index, columns, filters, use_threads)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _ipc_to_table(payload: bytes) -> pa.Table:
+    """Rebuild an Arrow table from IPC stream bytes."""
+    return pa.ipc.open_stream(payload).read_all()
+
+
 class ParquetFileSource(FileSource):
     """Parquet file source for reading Parquet data files.
 
     Args:
         file_path (str): Path to the Parquet file.
         monitor (PipelineMonitor): Monitor instance for logging.
-        batch_size (int): Number of rows to read at once. Defaults to 1000.
+        batch_size (int): Number of rows converted to dicts at once. The file is decoded one
+            row group at a time, so peak memory is bounded by the largest row group.
+            Defaults to 1000.
         columns (Optional[List[str]]): List of columns to read. If None, all columns are read.
         use_threads (bool): Whether to use multithreading for Parquet reading. Defaults to True.
         filters (Optional[List]): PyArrow filters to apply when reading. Defaults to None.
+        use_processes (bool): Whether to decode row groups in a process pool, up to max_workers
+            at a time, to avoid GIL contention with other sources. Defaults to False.
+        max_workers (Optional[int]): Number of worker processes when use_processes is enabled.
+            Defaults to the number of CPUs.
     """
 
     def __init__(
@@ -31,6 +75,8 @@ class ParquetFileSource(FileSource):
         columns: Optional[List[str]] = None,
         use_threads: bool = True,
         filters: Optional[List] = None,
+        use_processes: bool = False,
+        max_workers: Optional[int] = None,
     ):
         super().__init__(file_path, monitor)
         self._file_path = file_path
@@ -39,13 +85,19 @@ class ParquetFileSource(FileSource):
         self._use_threads = use_threads
         self._filters = filters
         self._executor = ThreadPoolExecutor(max_workers=2)  # Limit thread count
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._process_executor = (
+            ProcessPoolExecutor(max_workers=self._max_workers) if use_processes else None
+        )
 
-    async def _read_metadata(self) -> Dict[str, Any]:
+    async def _read_metadata(self, loop: asyncio.AbstractEventLoop) -> Dict[str, Any]:
         """Read Parquet file metadata asynchronously."""
         def _get_metadata():
             parquet_file = pq.ParquetFile(self._file_path)
             metadata = {
+                "parquet_file": parquet_file,
                 "num_rows": parquet_file.metadata.num_rows,
+                "num_row_groups": parquet_file.metadata.num_row_groups,
                 "num_columns": len(parquet_file.schema.names),
                 "schema": parquet_file.schema,
                 "columns": parquet_file.schema.names,
@@ -53,41 +105,73 @@ class ParquetFileSource(FileSource):
             }
             return metadata
 
-        return await asyncio.get_event_loop().run_in_executor(self._executor, _get_metadata)
+        return await loop.run_in_executor(self._executor, _get_metadata)
 
-    async def _read_batch(self, row_offset: int, batch_size: int) -> List[Dict[str, Any]]:
-        """Read a batch of rows from the Parquet file asynchronously."""
-        def _read_batch_sync():
-            table = pq.read_table(
-                self._file_path,
-                columns=self._columns,
-                filters=self._filters,
-                use_threads=self._use_threads
+    async def _iter_row_groups(
+        self, loop: asyncio.AbstractEventLoop, metadata: Dict[str, Any]
+    ) -> AsyncGenerator[pa.Table, None]:
+        """Yield the decoded row groups of the Parquet file in order."""
+        num_row_groups = metadata["num_row_groups"]
+
+        if not self._process_executor:
+            for index in range(num_row_groups):
+                yield await loop.run_in_executor(
+                    self._executor, _read_parquet_row_group,
+                    metadata["parquet_file"], index, self._columns, self._filters, self._use_threads,
+                )
+            return
+
+        # Keep up to max_workers row groups decoding in worker processes, yielding in file order
+        def _submit(index: int) -> asyncio.Future:
+            return loop.run_in_executor(
+                self._process_executor, _read_parquet_row_group_ipc,
+                self._file_path, index, self._columns, self._filters, self._use_threads,
             )
-            # Convert to pandas and then to dict records for easier processing
-            return table.to_pandas().to_dict(orient="records")
 
-        return await asyncio.get_event_loop().run_in_executor(self._executor, _read_batch_sync)
+        pending = deque(_submit(index) for index in range(min(self._max_workers, num_row_groups)))
+        next_index = len(pending)
+        try:
+            while pending:
+                payload = await pending.popleft()
+                if next_index < num_row_groups:
+                    pending.append(_submit(next_index))
+                    next_index += 1
+                yield await loop.run_in_executor(self._executor, _ipc_to_table, payload)
+        finally:
+            for future in pending:
+                future.cancel()
 
     async def generate(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Generate data from Parquet file source."""
         try:
+            loop = asyncio.get_running_loop()
+
             # Get metadata first to know total rows
-            metadata = await self._read_metadata()
+            metadata = await self._read_metadata(loop)
             total_rows = metadata["num_rows"]
             self.monitor.log_event(f"Parquet file {self._file_path} has {total_rows} rows")
 
-            # Read in batches
-            for offset in range(0, total_rows, self._batch_size):
-                batch_size = min(self._batch_size, total_rows - offset)
-                rows = await self._read_batch(offset, batch_size)
+            # Hoist per-row lookups out of the loop
+            log_debug = self.monitor.log_debug
+            debug_enabled = self.monitor.is_debug_enabled()
+
+            # Convert each decoded row group to dicts in batch_size slices
+            offset = 0
+            async for table in self._iter_row_groups(loop, metadata):
+                for batch in table.to_batches(max_chunksize=self._batch_size):
+                    # Convert straight from Arrow to dict records, skipping pandas
+                    rows = await loop.run_in_executor(self._executor, batch.to_pylist)
 
-                for row in rows:
-                    self.monitor.log_debug(f"Read row {offset} from Parquet file {self._file_path}")
-                    yield row
+                    for row in rows:
+                        if debug_enabled:
+                            log_debug(f"Read row {offset} from Parquet file {self._file_path}")
+                        offset += 1
+                        yield row
 
         except Exception as e:
             self.monitor.log_error(f"Error reading Parquet file {self._file_path}: {e}")
             raise
         finally:
             self._executor.shutdown(wait=False)
+            if self._process_executor:
+                self._process_executor.shutdown(wait=False, cancel_futures=True)
@@ -1,17 +1,49 @@
 """Twitter data source implementation."""
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, AsyncGenerator, Dict
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncGenerator, Dict, Optional
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.sources.base import Source
-from dateutil.parser import parse
 from twikit import Client, NotFound, TooManyRequests, Unauthorized
 import os
 
 from asyncdatapipeline.config import PipelineConfig
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# English month abbreviations used in ``created_at``; strptime's %b would follow the LC_TIME locale
+_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), start=1
+    )
+}
+
+
+def _parse_created_at(value: str) -> datetime:
+    """Parse a Twitter/X ``created_at`` value such as "Wed Oct 10 20:19:24 +0000 2018".
+
+    Month names are looked up in a fixed English table, so parsing doesn't depend on the locale.
+    The redundant weekday name is ignored.
+
+    Raises:
+        ValueError: If the value doesn't have the created_at layout.
+    """
+    try:
+        _, month, day, clock, offset, year = value.split()
+        hour, minute, second = clock.split(":")
+        if len(offset) != 5 or offset[0] not in "+-":
+            raise ValueError(offset)
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        tzinfo = timezone(-delta if offset[0] == "-" else delta)
+        return datetime(
+            int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second), tzinfo=tzinfo
+        )
+    except (KeyError, ValueError, IndexError) as e:
+        raise ValueError(f"Invalid created_at value: {value!r}") from e
+
 
 class TwitterSource(Source):
     """Twitter/X stream source using twikit."""
@@ -23,6 +55,7 @@ class TwitterSource(Source):
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(self._config.max_concurrent_tasks)
         self.cookie_path: str = self._config.cookie_path
         self.credentials: Dict[str, str] = self._config.twitter_credentials
+        self._client: Optional[Client] = None
 
     async def initialize_client(self) -> Client:
         """Initialize and authenticate Twitter client."""
@@ -50,20 +83,26 @@ class TwitterSource(Source):
                 raise
         return client
 
+    async def _get_client(self) -> Client:
+        """Get the authenticated client, initializing it on first use."""
+        if self._client is None:
+            self._client = await self.initialize_client()
+        return self._client
+
     async def generate(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Generate tweets from Twitter/X."""
         while True:
             try:
-                client: Client = await self.initialize_client()
+                client: Client = await self._get_client()
                 async with self.semaphore:
                     tweets = await client.search_tweet(self.query, product="Latest")
                 for tweet in tweets:
-                    tweet_time: str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    tweet_time: str = time.strftime(_TIMESTAMP_FORMAT)
                     yield {
                         "timestamp": tweet_time,
                         "username": tweet.user.name,
                         "text": tweet.text.replace(",", " "),
-                        "created_at": parse(tweet.created_at).strftime("%Y-%m-%d %H:%M:%S"),
+                        "created_at": _parse_created_at(tweet.created_at).strftime(_TIMESTAMP_FORMAT),
                         "retweets": tweet.retweet_count,
                         "likes": tweet.favorite_count,
                     }
@@ -83,6 +122,7 @@ class TwitterSource(Source):
                 continue
             except Unauthorized:
                 self.monitor.log_error("Authentication error detected. Attempting to re-authenticate")
+                self._client = None
                 try:
                     # Remove expired cookies
                     if os.path.exists("cookies.json"):
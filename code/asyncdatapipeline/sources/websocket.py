@@ -1,10 +1,10 @@
 """WebSocket data source implementation."""
 
 import asyncio
-import json
 from typing import AsyncGenerator, Dict, Any, Optional
 
 import aiohttp
+import orjson
 from aiohttp import ClientWebSocketResponse, WSMsgType
 
 from asyncdatapipeline.monitoring import PipelineMonitor
@@ -67,9 +67,10 @@ class WebSocketSource(Source):
 
     async def _process_message(self, message: aiohttp.WSMessage) -> Optional[Dict[str, Any]]:
         """Process WebSocket message and convert to standard format."""
-        if message.type == WSMsgType.TEXT:
+        if message.type in (WSMsgType.TEXT, WSMsgType.BINARY):
             try:
-                data = json.loads(message.data)
+                # orjson parses str and UTF-8 bytes frames alike
+                data = orjson.loads(message.data)
 
                 # Handle different message formats
                 if isinstance(data, dict):
@@ -86,7 +87,7 @@ class WebSocketSource(Source):
                     self.monitor.log_warning(f"Unexpected data format: {data}")
                     return None
 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 self.monitor.log_error(f"Error decoding JSON from WebSocket: {e}")
                 return None
 
@@ -103,6 +104,7 @@ class WebSocketSource(Source):
     async def generate(self) -> AsyncGenerator[Dict[str, Any], None]:
         """Generate data from WebSocket stream."""
         reconnect_attempts = 0
+        log_event = self.monitor.log_event
 
         while not self._closed:
             try:
@@ -120,7 +122,7 @@ class WebSocketSource(Source):
                     item = await self._process_message(message)
 
                     if item:
-                        self.monitor.log_event(f"Received item from WebSocket {self.url}")
+                        log_event(f"Received item from WebSocket {self.url}")
                         yield item
 
                 # If we reach here, the WebSocket was closed
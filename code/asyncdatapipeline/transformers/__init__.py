@@ -3,6 +3,8 @@
 from asyncdatapipeline.transformers.factory import (
     csv_dict_transformer,
     deduplication_transformer,
+    fused_transformer,
+    keyword_filter_transformer,
     nsfw_transformer,
     uppercase_transformer,
 )
@@ -12,4 +14,6 @@ __all__ = [
     "uppercase_transformer",
     "nsfw_transformer",
     "csv_dict_transformer",
+    "keyword_filter_transformer",
+    "fused_transformer",
 ]
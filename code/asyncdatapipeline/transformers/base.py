@@ -1,10 +1,20 @@
 """Base class for all transformers."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List, Union
+
+import orjson
+import xxhash
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 
+_INT64_MAX = (1 << 63) - 1
+
+
+def _to_int64(value: int) -> int:
+    """Reinterpret an unsigned 64-bit hash as signed, the int range every Bloom filter backend accepts."""
+    return value - (1 << 64) if value > _INT64_MAX else value
+
 
 class BaseTransformer(ABC):
     """Abstract base class for all data transformers."""
@@ -23,22 +33,54 @@ class BaseTransformer(ABC):
         """Transform data asynchronously."""
         pass
 
+    async def transform_batch(self, items: List[Any]) -> List[Any]:
+        """Transform a batch of data items asynchronously.
+
+        The default applies transform to each item in turn. Subclasses override this to
+        amortize per-item overhead or to run vectorized work over the whole batch.
+
+        Args:
+            items: The data items to transform
+
+        Returns:
+            One result per input item, in order, with None for items that were filtered out
+        """
+        return [await self.transform(item) for item in items]
+
+    async def close(self) -> None:
+        """Release background tasks and threads held by the transformer. Most transformers hold none."""
+        pass
+
     async def __call__(self, data: Any) -> Any:
         """Make the transformer callable for pipeline compatibility."""
         try:
             return await self.transform(data)
         except Exception as e:
-            self.monitor.log_error(f"Error in transformer {self.__class__.__name__}: {e}")
+            # Formatting, including the traceback, is left to logging for records that are emitted
+            self.monitor.log_error("Error in transformer %s: %s", self.__class__.__name__, e, exc_info=e)
             raise
 
-    def _get_key(self, data: Dict[str, Any]) -> str:
+    def _get_text(self, data: Any) -> Any:
+        """Extract the text content to analyze from a data item.
+
+        Args:
+            data: The data item (string or dict with a text field)
+
+        Returns:
+            The text content, or the data itself if it has no text field
+        """
+        if isinstance(data, dict):
+            return data.get("text")
+        return data
+
+    def _get_key(self, data: Dict[str, Any]) -> Union[str, int]:
         """Generate a unique key for the data item.
 
         Args:
             data: The data item to generate a key for
 
         Returns:
-            A string key for bloom filter
+            A string key for bloom filter, or a signed 64-bit hash for dicts without identifying fields
         """
         if not isinstance(data, dict):
             return str(data)
@@ -49,5 +91,13 @@ class BaseTransformer(ABC):
         elif 'text' in data and 'username' in data:
             return f"{data['username']}:{data['text']}"
         else:
-            # Create a key from all values, sorted by keys for consistency
-            return ":".join(f"{k}={v}" for k, v in sorted(data.items()))
+            # Hash a canonical (key-sorted) JSON encoding of the whole item
+            try:
+                return _to_int64(xxhash.xxh3_64_intdigest(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)))
+            except TypeError:
+                pass
+            # Not JSON-serializable: hash each item, sorted by keys for consistency
+            hasher = xxhash.xxh3_64()
+            for k in sorted(data):
+                hasher.update(f"{k}={data[k]};".encode())
+            return _to_int64(hasher.intdigest())
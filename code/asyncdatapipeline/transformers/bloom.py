@@ -0,0 +1,90 @@
+"""Bit-array Bloom filter implementation."""
+
+import math
+import os
+from typing import Optional, Union
+
+import xxhash
+
+_MASK_64 = (1 << 64) - 1
+
+
+class BitArrayBloomFilter:
+    """Bloom filter over a flat bit array with all probe positions derived from one hash.
+
+    Each key is hashed once with 128-bit xxh3. The low half is the base hash and the high half
+    is an additional hash that generates the remaining probe positions (Kirsch-Mitzenmacher
+    double hashing), so the cost per key is one hash regardless of the number of probes.
+    The probe loop runs in Python, so lookups are slower than in the native default backend.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, num_hashes: Optional[int] = None):
+        """
+        Initialize the Bloom filter.
+
+        Args:
+            capacity: Expected number of elements (n).
+            error_rate: Desired false positive rate, used to size the bit array.
+            num_hashes: Number of probe positions per key. Defaults to the optimal
+                (m/n)·ln2; 1 is cheaper and more accurate once the stream outgrows capacity.
+        """
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = num_hashes or max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def hashes(self) -> int:
+        """Number of probe positions per key."""
+        return self.num_hashes
+
+    def add_if_not_contains(self, key: Union[str, int, bytes]) -> bool:
+        """Insert the key and report whether it was (probably) already present."""
+        data = key if isinstance(key, bytes) else str(key).encode()
+        digest = xxhash.xxh3_128_intdigest(data)
+        base = digest & _MASK_64
+        step = (digest >> 64) | 1
+        bits = self._bits
+        size = self.size
+        present = True
+        for i in range(self.num_hashes):
+            position = (base + i * step) % size
+            index, mask = position >> 3, 1 << (position & 7)
+            if not bits[index] & mask:
+                present = False
+                bits[index] |= mask
+        return present
+
+
+class MmapBloomFilter:
+    """Bloom filter stored in a memory-mapped file using pybloomfiltermmap3.
+
+    The filter lives in the page cache rather than the Python heap, persists across restarts
+    and can be opened by several processes. Requires the optional ``pybloomfiltermmap3``
+    dependency.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, filename: str):
+        """
+        Open the Bloom filter file, creating it if it doesn't exist.
+
+        Args:
+            capacity: Expected number of elements (n), used when creating the file.
+            error_rate: Desired false positive rate, used when creating the file.
+            filename: Path of the memory-mapped filter file.
+        """
+        from pybloomfilter import BloomFilter
+
+        if os.path.exists(filename):
+            self._bloom = BloomFilter.open(filename)
+        else:
+            directory = os.path.dirname(filename)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._bloom = BloomFilter(capacity, error_rate, filename)
+
+    def hashes(self) -> int:
+        """Number of probe positions per key."""
+        return self._bloom.num_hashes
+
+    def add_if_not_contains(self, key: Union[str, int, bytes]) -> bool:
+        """Insert the key and report whether it was (probably) already present."""
+        return self._bloom.add(key)
@@ -1,27 +1,77 @@
+from typing import Any, Callable, List, Optional
+
 from asyncdatapipeline.monitoring import PipelineMonitor
+from asyncdatapipeline.transformers.fused import FusedTransformer
 from asyncdatapipeline.transformers.nsfw import NSFWTransformer
 from asyncdatapipeline.transformers.text import (
     UppercaseTransformer,
+    SingleHashDeduplicateTransformer,
     DeduplicateTransformer,
-    CSVToDictTransformer
+    MmapDeduplicateTransformer,
+    CSVToDictTransformer,
+    KeywordFilterTransformer,
 )
 
 
-def uppercase_transformer(monitor: PipelineMonitor):
-    """Factory function for creating uppercase transformer."""
-    return UppercaseTransformer(monitor)
+def uppercase_transformer(monitor: PipelineMonitor, mode: str = "auto"):
+    """Factory function for creating uppercase transformer.
+
+    Pass mode="str" or mode="dict" when every record has that type to skip per-record type checks.
+    """
+    return UppercaseTransformer(monitor, mode=mode)
 
 
-def nsfw_transformer(monitor: PipelineMonitor, threshold: float = 0.5):
+def nsfw_transformer(
+    monitor: PipelineMonitor,
+    threshold: float = 0.5,
+    max_batch_size: int = 32,
+    use_onnx_int8: bool = False,
+    cache_size: int = 65_536,
+    compile_model: bool = False,
+):
     """Factory function for creating NSFW content transformer."""
-    return NSFWTransformer(monitor, threshold=threshold)
+    return NSFWTransformer(
+        monitor,
+        threshold=threshold,
+        max_batch_size=max_batch_size,
+        use_onnx_int8=use_onnx_int8,
+        cache_size=cache_size,
+        compile_model=compile_model,
+    )
 
 
-def deduplication_transformer(monitor: PipelineMonitor, capacity: int = 10000, error_rate: float = 0.01):
-    """Factory function for creating deduplication transformer."""
+def deduplication_transformer(
+    monitor: PipelineMonitor,
+    capacity: int = 1_000_000,
+    error_rate: float = 0.01,
+    num_hashes: Optional[int] = None,
+    filename: Optional[str] = None,
+):
+    """Factory function for creating deduplication transformer.
+
+    Passing num_hashes selects the pure-Python bit-array Bloom filter backend, which supports a fixed probe count
+    but is slower than the default native backend.
+    Passing filename selects the memory-mapped backend, which persists seen keys in that file.
+    """
+    if num_hashes is not None and filename is not None:
+        raise ValueError("num_hashes and filename select different backends and cannot be combined")
+    if filename is not None:
+        return MmapDeduplicateTransformer(monitor, capacity=capacity, error_rate=error_rate, filename=filename)
+    if num_hashes is not None:
+        return SingleHashDeduplicateTransformer(monitor, capacity=capacity, error_rate=error_rate, num_hashes=num_hashes)
     return DeduplicateTransformer(monitor, capacity=capacity, error_rate=error_rate)
 
 
 def csv_dict_transformer(monitor: PipelineMonitor):
     """Factory function for creating CSV to dict transformer."""
     return CSVToDictTransformer(monitor)
+
+
+def keyword_filter_transformer(monitor: PipelineMonitor, keywords: List[str]):
+    """Factory function for creating keyword filter transformer."""
+    return KeywordFilterTransformer(monitor, keywords)
+
+
+def fused_transformer(monitor: PipelineMonitor, transformers: List[Callable[[Any], Any]]):
+    """Factory function for creating a fused chain of transformers."""
+    return FusedTransformer(monitor, transformers)
@@ -1,36 +1,96 @@
 """NSFW detector transformer implementation."""
 
 import asyncio
-from typing import Any, Dict, Optional
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import torch
+import xxhash
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.transformers.base import BaseTransformer
 
-from transformers.modeling_utils import PreTrainedModel
-from transformers.models.auto.modeling_auto import AutoModelForSequenceClassification
-from transformers.models.auto.tokenization_auto import AutoTokenizer
-from transformers.tokenization_utils import PreTrainedTokenizer
+if TYPE_CHECKING:
+    from transformers.modeling_utils import PreTrainedModel
+    from transformers.tokenization_utils import PreTrainedTokenizer
+
+# torch and transformers take seconds to import, so they are only imported once an
+# NSFWTransformer is created (see _import_backend)
+torch = None
+AutoModelForSequenceClassification = None
+AutoTokenizer = None
+
+
+def _import_backend() -> None:
+    """Import torch and the transformers auto classes on first use."""
+    global torch, AutoModelForSequenceClassification, AutoTokenizer
+    if torch is None:
+        import torch
+    if AutoModelForSequenceClassification is None:
+        from transformers.models.auto.modeling_auto import AutoModelForSequenceClassification
+    if AutoTokenizer is None:
+        from transformers.models.auto.tokenization_auto import AutoTokenizer
+
+
+def _sigmoid(x: float) -> float:
+    """Numerically stable logistic function."""
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1.0 + z)
 
 
 class NSFWTransformer(BaseTransformer):
     """Transformer for detecting and filtering NSFW content using qiuhuachuan/NSFW-detector."""
 
-    def __init__(self, monitor: PipelineMonitor, model_name: str = "eliasalbouzidi/distilbert-nsfw-text-classifier", threshold: float = 0.5):
+    def __init__(
+        self,
+        monitor: PipelineMonitor,
+        model_name: str = "eliasalbouzidi/distilbert-nsfw-text-classifier",
+        threshold: float = 0.5,
+        max_batch_size: int = 32,
+        use_onnx_int8: bool = False,
+        onnx_cache_dir: str = "models/onnx",
+        cache_size: int = 65_536,
+        compile_model: bool = False,
+    ):
         """
         Initialize the NSFW transformer.
 
         Args:
             threshold: Threshold for NSFW classification (0.0-1.0).
             monitor: Pipeline monitor instance. If None, a monitor must be provided during call.
+            max_batch_size: Maximum number of texts classified in one forward pass.
+            use_onnx_int8: Run a dynamically quantized INT8 ONNX model when no GPU is available.
+                Requires the optional ``optimum[onnxruntime]`` dependency.
+            onnx_cache_dir: Directory where the exported and quantized ONNX model is cached.
+            cache_size: Number of recent texts whose scores are cached so exact repeats such as
+                retweets skip inference. Set to 0 to disable the cache.
+            compile_model: Compile the PyTorch model with torch.compile and warm it up while loading,
+                trading a slower start for lower per-batch latency. Ignored for the ONNX model.
         """
         super().__init__(monitor)
+        _import_backend()
         self.threshold = threshold
         self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.use_onnx_int8 = use_onnx_int8
+        self.onnx_cache_dir = onnx_cache_dir
+        self.compile_model = compile_model
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-        self.tokenizer: PreTrainedTokenizer
-        self.model: PreTrainedModel
+        self.tokenizer: "PreTrainedTokenizer"
+        self.model: "PreTrainedModel"
         self._model_loaded = False
+        self._cuda_stream: Optional["torch.cuda.Stream"] = None
+        self._queue: Optional[asyncio.Queue[Tuple[str, asyncio.Future]]] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        # A single inference thread serializes forward passes: CUDA launches go to one stream and on
+        # CPU PyTorch's intra-op thread pool already spreads each batch across the cores
+        self._infer_executor: Optional[ThreadPoolExecutor] = None
+        # LRU cache of logit margins keyed by a 64-bit hash of the text to bound memory
+        self._cache: OrderedDict[int, float] = OrderedDict()
+        self._cache_size = cache_size
         self._load_model()
 
     def _load_model(self) -> None:
@@ -44,19 +104,192 @@ class NSFWTransformer(BaseTransformer):
         try:
             self.monitor.log_event(f"Loading NSFW detector model: {self.model_name}")
             self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
-            self.model.to(self.device)
-            self.model.eval()
+            if self.use_onnx_int8 and self.device.type == "cpu":
+                self.model = self._load_onnx_int8_model()
+            else:
+                self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                self.model.to(self.device)
+                self.model.eval()
+                if self.device.type == "cuda":
+                    self._enable_gpu_fast_math()
+                    self._cuda_stream = torch.cuda.Stream(device=self.device)
+                if self.compile_model:
+                    self._compile_model()
             self._model_loaded = True
             self.monitor.log_event("NSFW model loaded successfully")
         except Exception as e:
             self.monitor.log_error(f"Failed to load NSFW model: {e}")
             raise
 
+    def _enable_gpu_fast_math(self) -> None:
+        """Run the model in fp16 and allow TF32 tensor-core math on the GPU."""
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+        torch.set_float32_matmul_precision("high")
+        self.model.half()
+        self.monitor.log_event("Enabled fp16 inference with TF32 matmul on GPU")
+
+    def _compile_model(self) -> None:
+        """Compile the model and run a warmup batch so real requests don't pay the compile cost."""
+        # CUDA graphs cut kernel launch overhead on GPU; batches are padded per batch, so shapes vary
+        mode = "reduce-overhead" if self.device.type == "cuda" else "default"
+        self.model = torch.compile(self.model, mode=mode, dynamic=True)
+        self.monitor.log_event(f"Compiling NSFW model with torch.compile (mode={mode})")
+        self._infer_batch(["warmup"] * self.max_batch_size)
+        self.monitor.log_event("NSFW model compiled and warmed up")
+
+    def _load_onnx_int8_model(self) -> "PreTrainedModel":
+        """Load a dynamically quantized INT8 ONNX model, exporting it on first use."""
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        except ImportError:
+            self.monitor.log_warning("optimum[onnxruntime] is not installed, falling back to PyTorch inference")
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            model.to(self.device)
+            model.eval()
+            return model
+
+        save_dir = os.path.join(self.onnx_cache_dir, self.model_name.replace("/", "--"))
+        quantized_file = "model_quantized.onnx"
+        if not os.path.exists(os.path.join(save_dir, quantized_file)):
+            self.monitor.log_event(f"Exporting {self.model_name} to ONNX with INT8 quantization")
+            ort_model = ORTModelForSequenceClassification.from_pretrained(self.model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(ort_model)
+            quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=save_dir, quantization_config=quantization_config)
+
+        self.monitor.log_event(f"Using INT8 ONNX model from {save_dir}")
+        return ORTModelForSequenceClassification.from_pretrained(save_dir, file_name=quantized_file)
+
+    @staticmethod
+    def _cache_key(text: str) -> int:
+        """Hash a text to its cache key."""
+        return xxhash.xxh3_64_intdigest(text.encode())
+
+    def _cache_get(self, key: int) -> Optional[float]:
+        """Return the cached margin for a text hash, marking it as recently used."""
+        margin = self._cache.get(key)
+        if margin is not None:
+            self._cache.move_to_end(key)
+        return margin
+
+    def _cache_put(self, key: int, margin: float) -> None:
+        """Cache the margin for a text hash, evicting the least recently used entry when full."""
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = margin
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _get_queue(self) -> asyncio.Queue:
+        """Get the batching queue, starting the background batching task on first use."""
+        loop = asyncio.get_running_loop()
+        if self._batch_task is None or self._batch_task.done() or self._batch_task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_loop(self._queue))
+        return self._queue
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the inference thread pool, creating it on first use."""
+        if self._infer_executor is None:
+            self._infer_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nsfw-infer")
+        return self._infer_executor
+
+    async def close(self) -> None:
+        """Stop the background batching task and shut down the inference thread.
+
+        The transformer can still be used afterwards; both are recreated on demand.
+        """
+        task, queue = self._batch_task, self._queue
+        self._batch_task = None
+        self._queue = None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        # Texts that were queued but never batched would otherwise wait forever
+        while queue is not None and not queue.empty():
+            _, future = queue.get_nowait()
+            future.cancel()
+        if self._infer_executor is not None:
+            # Don't block the event loop on an in-flight forward pass; the thread exits once it finishes
+            self._infer_executor.shutdown(wait=False, cancel_futures=True)
+            self._infer_executor = None
+
+    def _infer_batch(self, texts: List[str]) -> List[float]:
+        """Tokenize and classify a batch of texts in a single forward pass.
+
+        Returns:
+            The nsfw-minus-safe logit margin for each text.
+        """
+        inputs = self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            max_length=512,
+            padding="longest"  # Pad to the longest text in the batch rather than 512 tokens
+        )
+        if self._cuda_stream is not None:
+            with torch.cuda.stream(self._cuda_stream):
+                # Pinned host buffers let the copies run asynchronously on the inference stream
+                inputs = {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+                with torch.inference_mode():
+                    logits = self.model(**inputs).logits
+                    margins = (logits[:, 1] - logits[:, 0]).float().to("cpu", non_blocking=True)
+            # Block only when the margins are consumed on the host
+            self._cuda_stream.synchronize()
+            return margins.tolist()
+
+        inputs = {k: v.to(self.device) for k, v in inputs.items()}
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+            # Keep the math on-device and copy a single margin per text back to the host
+            margins = (logits[:, 1] - logits[:, 0]).float()
+        return margins.cpu().tolist()
+
+    async def _batch_loop(self, queue: asyncio.Queue) -> None:
+        """Collect pending texts into batches and resolve their futures with the model output.
+
+        A batch is dispatched as soon as a text is queued, with whatever else is already waiting.
+        Texts that arrive during a forward pass queue up and make up the next batch, so a lone
+        caller never waits for stragglers.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                # Run inference on the inference thread to keep the event loop responsive
+                results = await loop.run_in_executor(
+                    self._get_executor(), self._infer_batch, [text for text, _ in batch]
+                )
+            except asyncio.CancelledError:
+                # close() stopped the loop mid-batch; don't leave the batch's callers waiting forever
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), margin in zip(batch, results):
+                if not future.done():
+                    future.set_result(margin)
+
     async def detect_nsfw(self, text: str) -> Optional[Dict[str, float]]:
         """
         Detect NSFW content in text asynchronously.
 
+        Concurrent calls are coalesced into batches by a background task.
+
         Args:
             text: Input text to analyze.
 
@@ -67,29 +300,17 @@ class NSFWTransformer(BaseTransformer):
             self._load_model()
 
         try:
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                truncation=True,
-                max_length=512,
-                padding="max_length"
-            )
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-
-            # Run inference in thread pool
-            loop = asyncio.get_running_loop()
+            key = self._cache_key(text)
+            margin = self._cache_get(key)
+            if margin is None:
+                future = asyncio.get_running_loop().create_future()
+                self._get_queue().put_nowait((text, future))
+                margin = await future
+                self._cache_put(key, margin)
 
-            def infer() -> torch.Tensor:
-                with torch.no_grad():
-                    outputs = self.model(**inputs)
-                    probs = torch.softmax(outputs.logits, dim=-1)
-                    return probs[0].cpu().numpy()
-            probs = await loop.run_in_executor(None, infer)
-
-            # Map to labels (0: safe, 1: nsfw)
-            labels = ["safe", "nsfw"]
-            result = {label: float(prob) for label, prob in zip(labels, probs)}
-            return result
+            # Map to labels (0: safe, 1: nsfw); a two-class softmax is the sigmoid of the logit margin
+            nsfw_score = _sigmoid(margin)
+            return {"safe": 1.0 - nsfw_score, "nsfw": nsfw_score}
         except Exception as e:
             self.monitor.log_error(f"NSFW detection failed: {e}")
             raise
@@ -106,7 +327,7 @@ class NSFWTransformer(BaseTransformer):
         """
         try:
             # Extract text
-            text = self._get_key(data)
+            text = self._get_text(data)
             if not isinstance(text, str) or not text.strip():
                 self.monitor.log_warning(f"Cannot analyze non-string or empty content: {type(text)}")
                 return data
@@ -123,3 +344,57 @@ class NSFWTransformer(BaseTransformer):
         except Exception as e:
             self.monitor.log_error(f"NSFW transformer error: {e}")
             raise
+
+    async def transform_batch(self, items: List[Any]) -> List[Any]:
+        """
+        Transform and filter NSFW content for a whole batch.
+
+        The batch is classified directly in forward passes of up to max_batch_size texts,
+        without going through the coalescing queue used by single-item calls.
+
+        Args:
+            items: Input data items (dicts with Text field or strings).
+
+        Returns:
+            The input items in order, with None in place of filtered items.
+        """
+        if not self._model_loaded:
+            self._load_model()
+
+        try:
+            results = list(items)
+            margins: Dict[int, float] = {}
+            texts: Dict[int, str] = {}
+            pending: List[int] = []
+            for i, data in enumerate(items):
+                text = self._get_text(data)
+                if not isinstance(text, str) or not text.strip():
+                    self.monitor.log_warning(f"Cannot analyze non-string or empty content: {type(text)}")
+                    continue
+                texts[i] = text
+                margin = self._cache_get(self._cache_key(text))
+                if margin is None:
+                    pending.append(i)
+                else:
+                    margins[i] = margin
+
+            loop = asyncio.get_running_loop()
+            for start in range(0, len(pending), self.max_batch_size):
+                chunk = pending[start:start + self.max_batch_size]
+                outputs = await loop.run_in_executor(
+                    self._get_executor(), self._infer_batch, [texts[i] for i in chunk]
+                )
+                for i, margin in zip(chunk, outputs):
+                    margins[i] = margin
+                    self._cache_put(self._cache_key(texts[i]), margin)
+
+            for i, margin in margins.items():
+                nsfw_score = _sigmoid(margin)
+                if nsfw_score >= self.threshold:
+                    self.monitor.log_event(
+                        f"Filtered NSFW tweet (score: {nsfw_score:.2f}) with content: {texts[i][:50]}...")
+                    results[i] = None
+            return results
+        except Exception as e:
+            self.monitor.log_error(f"NSFW transformer error: {e}")
+            raise
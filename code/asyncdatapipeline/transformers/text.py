@@ -1,23 +1,73 @@
 """Text transformers for data processing."""
 
-import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import ahocorasick
+import pyarrow as pa
+import pyarrow.compute as pc
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.transformers.base import BaseTransformer
-from rbloom import Bloom
+from asyncdatapipeline.transformers.bloom import BitArrayBloomFilter, MmapBloomFilter
+from fastbloom_rs import BloomFilter
 
 
 class UppercaseTransformer(BaseTransformer):
-    """Transforms string data to uppercase."""
+    """Transforms string data to uppercase.
+
+    Python strings use str.upper, which already has a C fast path for ASCII text. Arrow string
+    arrays are uppercased in place by Arrow's compute kernel without converting to Python objects.
+    When the record type is known up front, mode "str" or "dict" skips the per-record type checks.
+    """
+
+    MODES = ("auto", "str", "dict")
+
+    def __init__(self, monitor: PipelineMonitor, mode: str = "auto"):
+        """
+        Initialize the UppercaseTransformer.
+
+        Args:
+            monitor: PipelineMonitor for logging.
+            mode: "str" for string records, "dict" to uppercase the "text" field of dict records in place,
+                or "auto" to check each record's type and pass through anything that is not text.
+        """
+        super().__init__(monitor)
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown uppercase mode {mode!r}, expected one of {self.MODES}")
+        self.mode = mode
+        if mode == "str":
+            self._apply = str.upper
+        elif mode == "dict":
+            self._apply = self._upper_dict_text
+        else:
+            self._apply = self._upper_any
+
+    @staticmethod
+    def _upper_dict_text(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Uppercase the text field of a dict record."""
+        data["text"] = data["text"].upper()
+        return data
+
+    def _upper_any(self, data: Any) -> Any:
+        """Uppercase strings, bytes and Arrow string arrays, passing other data through.
+
+        bytes.upper() only changes ASCII letters, so other bytes such as UTF-8 sequences are kept.
+        """
+        if isinstance(data, (str, bytes)):
+            return data.upper()
+        if isinstance(data, (pa.Array, pa.ChunkedArray)):
+            return pc.utf8_upper(data)
+        if self.monitor.is_debug_enabled():
+            self.monitor.log_debug(f"Data is not a string: {data}")
+        return data
 
     async def transform(self, data: Any) -> Any:
         """Transform input string to uppercase."""
-        if not isinstance(data, str):
-            self.monitor.log_debug(f"Data is not a string: {data}")
-            return data
-        result = data.upper()
-        return result
+        return self._apply(data)
+
+    async def transform_batch(self, items: List[Any]) -> List[Any]:
+        """Transform a batch of strings to uppercase in one pass."""
+        apply = self._apply
+        return [apply(item) for item in items]
 
 
 class CSVToDictTransformer(BaseTransformer):
@@ -25,15 +75,19 @@ class CSVToDictTransformer(BaseTransformer):
 
     async def transform(self, line: Any) -> Optional[Dict[str, Any]]:
         """Transform CSV line to dictionary."""
+        debug_enabled = self.monitor.is_debug_enabled()
         if isinstance(line, dict):
-            self.monitor.log_debug(f"Line is already a dict: {line}")
+            # Already parsed upstream, e.g. by CSVFileSource(use_arrow=True)
+            if debug_enabled:
+                self.monitor.log_debug(f"Line is already a dict: {line}")
             return line
         try:
-            self.monitor.log_debug(f"Transforming line to dict: {line}")
+            if debug_enabled:
+                self.monitor.log_debug(f"Transforming line to dict: {line}")
             parts = line
             if isinstance(line, str):
                 parts = line.strip().split(',')
-            if len(parts) < 5:
+            if len(parts) < 6:
                 self.monitor.log_error(f"Invalid line format: {line}")
                 return {}
             tweet_data = {
@@ -50,6 +104,37 @@ class CSVToDictTransformer(BaseTransformer):
             return {}
 
 
+class KeywordFilterTransformer(BaseTransformer):
+    """Keeps only data containing at least one of the given keywords."""
+
+    def __init__(self, monitor: PipelineMonitor, keywords: List[str]):
+        """
+        Initialize the KeywordFilterTransformer.
+
+        Args:
+            monitor: PipelineMonitor for logging.
+            keywords: Keywords to match; data matching any of them passes through.
+        """
+        super().__init__(monitor)
+        if not keywords:
+            raise ValueError("At least one keyword must be provided")
+        # Aho-Corasick automaton matches all keywords in a single pass over the text
+        self._automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            self._automaton.add_word(keyword, keyword)
+        self._automaton.make_automaton()
+
+    async def transform(self, data: Any) -> Any:
+        """Filter out data that does not contain any keyword."""
+        text = self._get_text(data)
+        if not isinstance(text, str):
+            self.monitor.log_debug(f"Data has no text to match: {data}")
+            return data
+        if next(self._automaton.iter(text), None) is None:
+            return None
+        return data
+
+
 class DeduplicateTransformer(BaseTransformer):
     """Removes duplicate data using a Bloom Filter."""
 
@@ -59,17 +144,25 @@ class DeduplicateTransformer(BaseTransformer):
 
         Args:
             monitor: PipelineMonitor for logging.
-            capacity: Expected number of elements (n).
+            capacity: Expected number of elements (n). Size this to the expected stream length; once
+                more distinct items are inserted the false positive rate climbs quickly.
             error_rate: Desired false positive rate (e.g., 0.01 for 1%).
         """
         super().__init__(monitor)
         try:
-            self.bloom = Bloom(capacity, error_rate)
-            self.monitor.log_event(f"Initialized Bloom Filter: capacity={capacity}, error_rate={error_rate}")
+            self.bloom = self._create_bloom(capacity, error_rate)
+            self.monitor.log_event(
+                f"Initialized Bloom Filter: capacity={capacity}, error_rate={error_rate}, "
+                f"hashes={self.bloom.hashes()}"
+            )
         except Exception as e:
             self.monitor.log_error(f"Failed to initialize Bloom Filter: {e}")
             raise
 
+    def _create_bloom(self, capacity: int, error_rate: float) -> Any:
+        """Create the Bloom filter backend."""
+        return BloomFilter(capacity, error_rate)
+
     async def transform(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Filter out duplicate data using Bloom Filter."""
         key = self._get_key(data)
@@ -77,20 +170,87 @@ class DeduplicateTransformer(BaseTransformer):
             return data
 
         try:
-            # Check and add to Bloom Filter asynchronously
-            loop = asyncio.get_running_loop()
-
-            def check_and_add() -> bool:
-                in_filter = key in self.bloom
-                if not in_filter:
-                    self.bloom.add(key)
-                return in_filter
-            is_duplicate = await loop.run_in_executor(None, check_and_add)
+            # Check and insert in one call so the key is only hashed once. This takes nanoseconds,
+            # far less than dispatching it to a thread pool, so it runs inline on the event loop.
+            is_duplicate = self.bloom.add_if_not_contains(key)
 
             if is_duplicate:
-                self.monitor.log_event(f"Filtered duplicate: {key[:50]}...")
+                self.monitor.log_event(f"Filtered duplicate: {str(key)[:50]}...")
                 return None
             return data
         except Exception as e:
             self.monitor.log_error(f"DeduplicateTransformer error: {e}")
             raise
+
+    async def transform_batch(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Filter out duplicates within and across batches using Bloom Filter."""
+        add_if_not_contains = self.bloom.add_if_not_contains
+        results = []
+        try:
+            for data in items:
+                key = self._get_key(data)
+                if key and add_if_not_contains(key):
+                    self.monitor.log_event(f"Filtered duplicate: {str(key)[:50]}...")
+                    results.append(None)
+                else:
+                    results.append(data)
+            return results
+        except Exception as e:
+            self.monitor.log_error(f"DeduplicateTransformer error: {e}")
+            raise
+
+
+class SingleHashDeduplicateTransformer(DeduplicateTransformer):
+    """Removes duplicate data using a pure-Python bit-array Bloom filter hashed once per key.
+
+    Unlike the default backend, the number of probe positions is configurable, so the
+    filter can run with a single probe per key for unbounded streams. The probes are
+    computed in Python, so this is slower than the default native backend; it trades
+    speed for the configurable probe count and no native dependency.
+    """
+
+    def __init__(self, monitor: PipelineMonitor, capacity: int, error_rate: float, num_hashes: Optional[int] = None):
+        """
+        Initialize the SingleHashDeduplicateTransformer.
+
+        Args:
+            monitor: PipelineMonitor for logging.
+            capacity: Expected number of elements (n).
+            error_rate: Desired false positive rate, used to size the bit array.
+            num_hashes: Number of probe positions per key. Defaults to the optimal count.
+        """
+        self._num_hashes = num_hashes
+        super().__init__(monitor, capacity, error_rate)
+
+    def _create_bloom(self, capacity: int, error_rate: float) -> BitArrayBloomFilter:
+        """Create the bit-array Bloom filter backend."""
+        return BitArrayBloomFilter(capacity, error_rate, self._num_hashes)
+
+
+class MmapDeduplicateTransformer(DeduplicateTransformer):
+    """Removes duplicate data using a Bloom filter in a memory-mapped file.
+
+    Seen keys survive restarts, which pairs with checkpoint recovery. Falls back to the
+    in-memory filter when pybloomfiltermmap3 is not installed.
+    """
+
+    def __init__(self, monitor: PipelineMonitor, capacity: int, error_rate: float, filename: str):
+        """
+        Initialize the MmapDeduplicateTransformer.
+
+        Args:
+            monitor: PipelineMonitor for logging.
+            capacity: Expected number of elements (n), used when creating the filter file.
+            error_rate: Desired false positive rate, used when creating the filter file.
+            filename: Path of the memory-mapped filter file; an existing file is reopened.
+        """
+        self.filename = filename
+        super().__init__(monitor, capacity, error_rate)
+
+    def _create_bloom(self, capacity: int, error_rate: float) -> Any:
+        """Open the memory-mapped Bloom filter backend."""
+        try:
+            return MmapBloomFilter(capacity, error_rate, self.filename)
+        except ImportError:
+            self.monitor.log_warning("pybloomfiltermmap3 is not installed, falling back to an in-memory Bloom filter")
+            return super()._create_bloom(capacity, error_rate)
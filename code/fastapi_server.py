@@ -1,11 +1,13 @@
 """FastAPI server with REST and WebSocket endpoints serving fake data."""
 
 import asyncio
-import json
+import itertools
 import random
+import time
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set
 
+import orjson
 import uvicorn
 from faker import Faker
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
@@ -20,21 +22,28 @@ faker = Faker()
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        # Send to all clients concurrently and drop the ones whose send failed
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(message) for connection in connections),
+            return_exceptions=True
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 manager = ConnectionManager()
@@ -62,6 +71,40 @@ def generate_fake_tweet() -> Dict[str, Any]:
     }
 
 
+# Faker is slow, so tweets are generated once at startup and served round-robin
+FAKE_TWEET_POOL_SIZE = 10_000
+_POOL = [generate_fake_tweet() for _ in range(FAKE_TWEET_POOL_SIZE)]
+_POOL_IDX = itertools.cycle(range(len(_POOL)))
+
+_timestamp_second = 0
+_timestamp_str = ""
+
+
+def _now_str() -> str:
+    """Current timestamp string, formatted at most once per second."""
+    global _timestamp_second, _timestamp_str
+    second = int(time.time())
+    if second != _timestamp_second:
+        _timestamp_second = second
+        _timestamp_str = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+    return _timestamp_str
+
+
+# Envelope for streamed tweets, pre-encoded so only the tweet itself is serialized per message
+_TWEET_MESSAGE_PREFIX = b'{"type":"tweet","data":'
+_TWEET_MESSAGE_SUFFIX = b'}'
+
+
+def encode_tweet_message(tweet: Dict[str, Any]) -> bytes:
+    """Encode a tweet as a {"type": "tweet", "data": ...} JSON message."""
+    return _TWEET_MESSAGE_PREFIX + orjson.dumps(tweet) + _TWEET_MESSAGE_SUFFIX
+
+
+def next_fake_tweet() -> Dict[str, Any]:
+    """Get the next pregenerated fake tweet with a fresh timestamp."""
+    return _POOL[next(_POOL_IDX)] | {"timestamp": _now_str()}
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -71,13 +114,13 @@ async def root():
 @app.get("/tweets", response_model=List[Tweet])
 async def get_tweets(count: int = 10):
     """REST endpoint to get a batch of fake tweets."""
-    return [generate_fake_tweet() for _ in range(count)]
+    return [next_fake_tweet() for _ in range(count)]
 
 
 @app.get("/tweet", response_model=Tweet)
 async def get_single_tweet():
     """REST endpoint to get a single fake tweet."""
-    return generate_fake_tweet()
+    return next_fake_tweet()
 
 
 @app.websocket("/ws")
@@ -87,11 +130,9 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         # Stream fake tweets continuously
         while True:
-            tweet = generate_fake_tweet()
-            await manager.send_personal_message(
-                json.dumps({"type": "tweet", "data": tweet}),
-                websocket
-            )
+            tweet = next_fake_tweet()
+            # orjson emits UTF-8 bytes, sent as a binary frame without re-encoding
+            await websocket.send_bytes(encode_tweet_message(tweet))
             await asyncio.sleep(1)  # Send a tweet every second
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -7,7 +7,7 @@ from asyncdatapipeline.destinations import (
     sql_destination,
 )
 from asyncdatapipeline.monitoring import PipelineMonitor
-from asyncdatapipeline.pipeline import AsyncDataPipeline, PipelineConfig
+from asyncdatapipeline.pipeline import AsyncDataPipeline, PipelineConfig, install_uvloop
 from asyncdatapipeline.sources import api_source, file_source, twitter_source, websocket_source
 from asyncdatapipeline.transformers import (
     csv_dict_transformer,
@@ -18,27 +18,20 @@ from asyncdatapipeline.transformers import (
 from huggingface_hub import login
 
 
-async def main():
-    # Configure with multipart processing enabled
-    config = PipelineConfig(
-        max_concurrent_tasks=5,
-        enable_recovery=True,
-        checkpoint_path="checkpoints/pipeline_state.json",
-        multipart_enabled=True,
-        multipart_threshold=50 * 1024 * 1024,  # 50MB threshold
-        multipart_chunk_size=2 * 1024 * 1024,  # 2MB chunks
-    )
-
+async def main(config: PipelineConfig):
     # Login to Hugging Face Hub
     login(config.huggingface_token)
 
     # Create monitor reference first
     monitor = PipelineMonitor()
 
-    # Get current date and date 2 years ago for query
-    current_date = datetime.now().strftime("%Y-%m-%d")
-    two_years_ago = datetime.now().replace(year=datetime.now().year - 2).strftime("%Y-%m-%d")
-    QUERY = f'(from:elonmusk) lang:en until:{current_date} since:{two_years_ago}'
+    # Only build the Twitter query when the Twitter source is enabled
+    twitter_source_enabled = False
+    if twitter_source_enabled:
+        # Get current date and date 2 years ago for query
+        today = datetime.now().date()
+        two_years_ago = today.replace(year=today.year - 2)
+        QUERY = f'(from:elonmusk) lang:en until:{today.isoformat()} since:{two_years_ago.isoformat()}'
 
     # Helper to capture the monitor from the pipeline
     def set_monitor_and_create_pipeline():
@@ -46,7 +39,7 @@ async def main():
         pipeline = AsyncDataPipeline(
             sources=[
                 # Twitter Source
-                # lambda: twitter_source(config, monitor, QUERY),
+                *([lambda: twitter_source(config, monitor, QUERY)] if twitter_source_enabled else []),
 
                 # REST API Source
                 lambda: api_source("http://localhost:9001/tweet", monitor),
@@ -81,7 +74,7 @@ async def main():
             transformers=[
                 # uppercase_transformer(monitor),
                 csv_dict_transformer(monitor),
-                deduplication_transformer(monitor, capacity=10000, error_rate=0.01),
+                deduplication_transformer(monitor, capacity=1_000_000, error_rate=0.01),
                 nsfw_transformer(monitor),
             ],
             destinations=[
@@ -111,4 +104,15 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Configure with multipart processing enabled
+    config = PipelineConfig(
+        max_concurrent_tasks=5,
+        enable_recovery=True,
+        checkpoint_path="checkpoints/pipeline_state.json",
+        multipart_enabled=True,
+        multipart_threshold=50 * 1024 * 1024,  # 50MB threshold
+        multipart_chunk_size=2 * 1024 * 1024,  # 2MB chunks
+    )
+    # The event loop policy has to be chosen before asyncio.run() creates the loop
+    install_uvloop(config)
+    asyncio.run(main(config))
@@ -1,50 +1,52 @@
 import csv
 from datetime import datetime
 import os
-import tracemalloc
 import aiofiles
 import asyncio
 
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.config import PipelineConfig
+from asyncdatapipeline.pipeline import install_uvloop
 from asyncdatapipeline.sources import twitter_source
 
 
-# Enable tracemalloc to track memory allocations
-tracemalloc.start()
+# Track memory allocations only when asked to, tracing adds overhead to every allocation
+if os.environ.get("PIPELINE_TRACE_MALLOC"):
+    import tracemalloc
 
+    tracemalloc.start(int(os.environ.get("TRACEMALLOC_FRAMES", "1")))
 
-async def write_batch_to_file(filename, batch):
-    """Write a batch of tweets to CSV file"""
+# Number of CSV rows buffered before they are written to the file
+WRITE_BATCH_SIZE = 1000
+
+
+async def write_batch_to_file(f, batch):
+    """Write a batch of CSV lines to an open file in a single write"""
     try:
-        async with aiofiles.open(filename, 'a', newline='', encoding='utf-8') as f:
-            for tweet_time, tweet_text in batch:
-                await f.write(f"{tweet_time},{tweet_text}\n")
+        await f.write("".join(batch))
     except Exception as e:
         # Log but don't crash the application
         monitor = PipelineMonitor()
-        monitor.log_event(f"Error writing to file {filename}: {str(e)}")
+        monitor.log_event(f"Error writing to file {f.name}: {str(e)}")
 
 
-async def main():
+async def main(config: PipelineConfig):
     """Main function to run the Twitter client"""
-    # Load credentials and initialize client
-    config = PipelineConfig(
-        max_concurrent_tasks=5
-    )
+    # Initialize client with the loaded credentials
     monitor = PipelineMonitor()
 
     # Get current date and date 2 years ago for query
-    current_date = datetime.now().strftime("%Y-%m-%d")
-    two_years_ago = datetime.now().replace(year=datetime.now().year - 2).strftime("%Y-%m-%d")
+    now = datetime.now()
+    today = now.date()
+    two_years_ago = today.replace(year=today.year - 2)
 
-    QUERY = f'(from:elonmusk) lang:en until:{current_date} since:{two_years_ago}'
+    QUERY = f'(from:elonmusk) lang:en until:{today.isoformat()} since:{two_years_ago.isoformat()}'
 
     tweet_count = 0
     max_tweets = 100  # Set a limit for the number of tweets to process
 
     # Create CSV file with timestamp in filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     csv_filename = f"inputs/tweets_{timestamp}.csv"
     # Check if file exists, if not create it
     if not os.path.exists(csv_filename):
@@ -58,17 +60,29 @@ async def main():
 
     monitor.log_event(f"Created CSV file: {csv_filename}")
 
-    async for tweet in twitter_source(config.twitter_credentials, monitor, query=QUERY):
-        print(f"Tweet {tweet}")
-        tweet_count += 1
-        # Append tweet to CSV file
-        tweet['text'] = tweet['text'].replace(",", " ").replace("\n", " ")
-        async with aiofiles.open(csv_filename, "a", newline="", encoding="utf-8") as f:
-            csv_line = f"{tweet['timestamp']},{tweet['username']},{tweet['text']},{tweet['created_at']},{tweet['retweets']},{tweet['likes']}\n"
-            await f.write(csv_line)
-        if tweet_count >= max_tweets:
-            break
+    # Keep one handle open for the whole run and append tweets in batches
+    async with aiofiles.open(csv_filename, "a", newline="", encoding="utf-8") as f:
+        batch = []
+        async for tweet in twitter_source(config, monitor, query=QUERY):
+            print(f"Tweet {tweet}")
+            tweet_count += 1
+            tweet['text'] = tweet['text'].replace(",", " ").replace("\n", " ")
+            batch.append(
+                f"{tweet['timestamp']},{tweet['username']},{tweet['text']},{tweet['created_at']},{tweet['retweets']},{tweet['likes']}\n"
+            )
+            if len(batch) >= WRITE_BATCH_SIZE:
+                await write_batch_to_file(f, batch)
+                batch = []
+            if tweet_count >= max_tweets:
+                break
+        if batch:
+            await write_batch_to_file(f, batch)
 
 if __name__ == "__main__":
-    # Use asyncio.run to properly run the async main function
-    asyncio.run(main())
+    # Load credentials, then run the async main function on uvloop unless the config opts out.
+    # The event loop policy has to be chosen before asyncio.run() creates the loop.
+    config = PipelineConfig(
+        max_concurrent_tasks=5
+    )
+    install_uvloop(config)
+    asyncio.run(main(config))
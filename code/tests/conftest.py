@@ -1,12 +1,11 @@
 """Configure pytest for asyncdatapipeline tests."""
 
 from asyncdatapipeline.config import PipelineConfig
-from asyncdatapipeline.monitoring import PipelineMonitor
+from asyncdatapipeline.monitoring import NullMonitor
 import os
 import sys
 import pytest
 import asyncio
-from unittest.mock import MagicMock
 
 # Add the code directory to path
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -15,26 +14,62 @@ if code_dir not in sys.path:
     sys.path.insert(0, code_dir)
 
 
-@pytest.fixture
-def event_loop():
-    """Create an instance of the default event loop for each test."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    asyncio.set_event_loop(loop)
-    yield loop
-    loop.close()
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is installed, as the pipeline does."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+class CountingMonitor(NullMonitor):
+    """NullMonitor that records log messages by level, for tests that assert on logging."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages = {"debug": [], "event": [], "warning": [], "error": []}
+
+    def log_debug(self, message: str, *args) -> None:
+        self.messages["debug"].append(message % args if args else message)
+
+    def log_event(self, message: str, *args) -> None:
+        self.messages["event"].append(message % args if args else message)
+
+    def log_warning(self, message: str, *args) -> None:
+        self.messages["warning"].append(message % args if args else message)
+
+    def log_error(self, message: str, *args, exc_info=None) -> None:
+        self.messages["error"].append(message % args if args else message)
 
 
 @pytest.fixture
 def monitor():
-    """Create a PipelineMonitor with mocked logging for testing."""
-    monitor = PipelineMonitor()
-    # Override the logger to avoid file writes during tests
-    monitor.log_event = MagicMock()
-    monitor.log_error = MagicMock()
-    monitor.log_debug = MagicMock()
-    monitor.log_warning = MagicMock()
-    return monitor
+    """Create a monitor that discards logging for testing."""
+    return NullMonitor()
+
+
+@pytest.fixture
+def counting_monitor():
+    """Create a monitor that records log messages for testing."""
+    return CountingMonitor()
+
+
+@pytest.fixture(scope="session")
+def shared_text_file(tmp_path_factory):
+    """Create a read-only text file shared by all tests in a session (or xdist worker)."""
+    file_path = tmp_path_factory.mktemp("inputs") / "lines.txt"
+    file_path.write_text("line 1\nline 2\nline 3\n")
+    return str(file_path)
+
+
+@pytest.fixture(scope="session")
+def shared_csv_file(tmp_path_factory):
+    """Create a read-only CSV file shared by all tests in a session (or xdist worker)."""
+    file_path = tmp_path_factory.mktemp("inputs") / "items.csv"
+    file_path.write_text("id,name,value\n1,item1,100\n2,item2,200\n3,item3,300\n")
+    return str(file_path)
 
 
 @pytest.fixture
@@ -4,12 +4,24 @@ from unittest.mock import patch
 
 from asyncdatapipeline.config import (
     PipelineConfig,
+    _clear_env_cache,
     _get_twitter_credentials,
     _get_postgres_info,
-    _get_mongo_info
+    _get_mongo_info,
+    _load_mongo_info,
+    _load_postgres_info,
+    _load_twitter_credentials,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_env_cache():
+    """Re-read environment variables in every test so patched values are observed."""
+    _clear_env_cache()
+    yield
+    _clear_env_cache()
+
+
 def test_config_defaults():
     """Test that default configuration values are set correctly."""
     config = PipelineConfig()
@@ -123,3 +135,31 @@ def test_config_factory_functions():
     assert isinstance(config.twitter_credentials, dict)
     assert isinstance(config.postgres, dict)
     assert isinstance(config.mongo, dict)
+
+
+def test_config_instances_do_not_share_dicts():
+    """Test that cached environment values are copied per config instance."""
+    first = PipelineConfig()
+    second = PipelineConfig()
+
+    first.postgres["credentials"]["host"] = "changed"
+    first.mongo["credentials"]["host"] = "changed"
+    first.twitter_credentials["username"] = "changed"
+
+    assert second.postgres["credentials"]["host"] != "changed"
+    assert second.mongo["credentials"]["host"] != "changed"
+    assert second.twitter_credentials["username"] != "changed"
+
+
+def test_config_credentials_are_lazy():
+    """Test that credential dictionaries are only built on first access."""
+    config = PipelineConfig()
+    assert _load_twitter_credentials.cache_info().misses == 0
+    assert _load_postgres_info.cache_info().misses == 0
+    assert _load_mongo_info.cache_info().misses == 0
+
+    assert config.postgres is config.postgres
+    assert _load_postgres_info.cache_info().misses == 1
+
+    config.mongo = {"name": "custom"}
+    assert config.mongo == {"name": "custom"}
@@ -1,10 +1,11 @@
 import asyncio
-import json
+import csv
+import io
 import os
-import tempfile
 from unittest.mock import MagicMock, patch
 
 import aiofiles
+import orjson
 import pytest
 from asyncdatapipeline.destinations.api import ApiDestination
 from asyncdatapipeline.destinations.file import (
@@ -12,26 +13,19 @@ from asyncdatapipeline.destinations.file import (
     FileDestination,
     JSONFileDestination,
 )
-from asyncdatapipeline.monitoring import PipelineMonitor
+from asyncdatapipeline.monitoring import NullMonitor
 
 
 @pytest.fixture
 def monitor():
     """Create a monitor fixture for testing."""
-    monitor = PipelineMonitor()
-    # Override the logger to avoid file writes during tests
-    monitor.log_event = MagicMock()
-    monitor.log_error = MagicMock()
-    monitor.log_debug = MagicMock()
-    monitor.log_warning = MagicMock()
-    return monitor
+    return NullMonitor()
 
 
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory."""
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield tmpdirname
+def temp_dir(tmp_path):
+    """Create a temporary directory for each test's output files."""
+    return str(tmp_path)
 
 
 @pytest.mark.asyncio
@@ -42,6 +36,7 @@ async def test_file_destination(monitor, temp_dir):
 
     test_data = {"id": 1, "text": "Hello world", "count": 42}
     await destination.send(test_data)
+    await destination.close()
 
     # Verify the file was created and contains the expected content
     assert os.path.exists(output_file)
@@ -59,13 +54,14 @@ async def test_json_file_destination(monitor, temp_dir):
 
     test_data = {"id": 1, "text": "Hello world", "count": 42}
     await destination.send(test_data)
+    await destination.close()
 
     # Verify the file was created and contains the expected content
     assert os.path.exists(output_file)
 
-    async with aiofiles.open(output_file, "r") as f:
+    async with aiofiles.open(output_file, "rb") as f:
         content = await f.read()
-        loaded_data = json.loads(content)
+        loaded_data = orjson.loads(content.splitlines()[0])
         assert loaded_data["id"] == 1
         assert loaded_data["text"] == "Hello world"
         assert loaded_data["count"] == 42
@@ -75,10 +71,12 @@ async def test_json_file_destination(monitor, temp_dir):
 async def test_csv_file_destination(monitor, temp_dir):
     """Test the CSV file destination."""
     output_file = os.path.join(temp_dir, "output.csv")
-    destination = CSVFileDestination(output_file, monitor)
+    destination = CSVFileDestination(output_file, monitor, fieldnames=("id", "name", "value"))
 
     test_data = {"id": 1, "name": "test item", "value": 100}
     await destination.send(test_data)
+    await destination.send({"value": None, "name": 'item, "quoted"', "id": 2})
+    await destination.close()
 
     # Verify the file was created
     assert os.path.exists(output_file)
@@ -87,12 +85,89 @@ async def test_csv_file_destination(monitor, temp_dir):
     async with aiofiles.open(output_file, "r") as f:
         content = await f.read()
         assert "1,test item,100" in content
+        assert '2,"item, ""quoted""",' in content
+
+
+@pytest.mark.asyncio
+async def test_file_destination_buffering(monitor, temp_dir):
+    """Test that records are buffered until the buffer fills or the destination is flushed."""
+    output_file = os.path.join(temp_dir, "output.json")
+    destination = JSONFileDestination(output_file, monitor, max_buffer_bytes=64)
+
+    await destination.send({"id": 1})
+    assert not os.path.exists(output_file)
+
+    await destination.send({"id": 2, "text": "x" * 64})
+    await destination.send({"id": 3})
+    await destination.flush()
+    await destination.send({"id": 4})
+    await destination.close()
+
+    async with aiofiles.open(output_file, "rb") as f:
+        lines = (await f.read()).splitlines()
+    assert [orjson.loads(line)["id"] for line in lines] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_file_destination_failed_flush_keeps_buffer(monitor, temp_dir):
+    """Test that a failed write keeps buffered records and a retried send adds its record once."""
+    output_file = os.path.join(temp_dir, "output.json")
+    destination = JSONFileDestination(output_file, monitor, max_buffer_bytes=16)
+
+    await destination.send({"id": 1})
+    with patch("aiofiles.open", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            await destination.send({"id": 2, "text": "x" * 16})
+    await destination.send({"id": 2, "text": "x" * 16})
+    await destination.close()
+
+    async with aiofiles.open(output_file, "rb") as f:
+        lines = (await f.read()).splitlines()
+    assert [orjson.loads(line)["id"] for line in lines] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_file_destination_send_batch(monitor, temp_dir):
+    """Test that a batch of records is written in order."""
+    output_file = os.path.join(temp_dir, "output.csv")
+    destination = CSVFileDestination(output_file, monitor)
+
+    await destination.send_batch([{"id": 1, "name": "a"}, {"id": 2, "name": "b, c"}])
+    await destination.close()
+
+    async with aiofiles.open(output_file, "r", newline="") as f:
+        content = await f.read()
+    assert content == '1,a\r\n2,"b, c"\r\n'
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [""],
+        [None],
+        ["single"],
+        ["", ""],
+        [None, None],
+        ["a,b", 1],
+        ['say "hi"', 2.5],
+        ["line\nbreak", "carriage\rreturn"],
+        ["crlf\r\n", True],
+    ],
+)
+def test_csv_file_destination_matches_csv_writer(monitor, temp_dir, values):
+    """Test that formatted rows are byte-identical to csv.writer output."""
+    fieldnames = [f"c{i}" for i in range(len(values))]
+    destination = CSVFileDestination(os.path.join(temp_dir, "output.csv"), monitor, fieldnames=fieldnames)
+
+    expected = io.StringIO()
+    csv.writer(expected).writerow(values)
+    assert destination._format(dict(zip(fieldnames, values))) == expected.getvalue()
 
 
 @pytest.mark.asyncio
-async def test_api_destination():
+async def test_api_destination(monitor):
     """Test the API destination with mocked HTTP responses."""
-    monitor = MagicMock()
 
     # Mock ClientSession.post
     with patch("aiohttp.ClientSession.post") as mock_post:
@@ -110,13 +185,23 @@ async def test_api_destination():
         # Verify the API was called with the right data
         mock_post.assert_called_once()
         _, kwargs = mock_post.call_args
-        assert kwargs["json"]["data"] == test_data
+        assert orjson.loads(kwargs["data"])["data"] == test_data
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+        # Later sends reuse the same session
+        session = destination._session
+        await destination.send(test_data)
+        assert destination._session is session
+        assert mock_post.call_count == 2
+
+        await destination.close()
+        assert session.closed
 
 
 @pytest.mark.asyncio
-async def test_api_destination_error():
+async def test_api_destination_error(counting_monitor):
     """Test handling of API errors."""
-    monitor = MagicMock()
+    monitor = counting_monitor
 
     # Mock ClientSession.post with error response
     with patch("aiohttp.ClientSession.post") as mock_post:
@@ -131,6 +216,7 @@ async def test_api_destination_error():
         test_data = {"id": 1, "text": "test data"}
         with pytest.raises(ValueError):
             await destination.send(test_data)
+        await destination.close()
 
         # Verify the error was logged
-        monitor.log_error.assert_called_once()
+        assert len(monitor.messages["error"]) == 1
@@ -1,10 +1,10 @@
 import os
 import pytest
 import tempfile
-import time
+from collections import deque
 from unittest.mock import patch, MagicMock
 
-from asyncdatapipeline.monitoring import PipelineMonitor, LoggingFormatter
+from asyncdatapipeline.monitoring import LoggingFormatter, NullMonitor, PipelineMonitor
 
 
 def test_pipeline_monitor_initialization():
@@ -15,7 +15,8 @@ def test_pipeline_monitor_initialization():
             # Check that metrics are initialized correctly
             assert monitor.metrics["throughput"] == 0
             assert monitor.metrics["errors"] == 0
-            assert isinstance(monitor.metrics["latency"], list)
+            assert isinstance(monitor.metrics["latency"], deque)
+            assert monitor.metrics["latency"].maxlen == PipelineMonitor.LATENCY_WINDOW_SIZE
 
 
 def test_logging_methods():
@@ -24,6 +25,7 @@ def test_logging_methods():
 
     # Patch the logger to avoid actual logging
     monitor.logger = MagicMock()
+    monitor.logger.isEnabledFor.return_value = True
 
     # Test each logging method
     monitor.log_debug("Debug message")
@@ -36,24 +38,46 @@ def test_logging_methods():
     monitor.logger.warning.assert_called_with("Warning message")
 
     monitor.log_error("Error message")
-    monitor.logger.error.assert_called_with("Error message")
+    monitor.logger.error.assert_called_with("Error message", exc_info=None)
 
     # Error should increment the error count
     assert monitor.metrics["errors"] == 1
 
+    # Format args are passed through for logging to apply lazily
+    monitor.log_event("Processed %d items", 3)
+    monitor.logger.info.assert_called_with("Processed %d items", 3)
+
+    # Disabled levels are skipped before reaching the logger
+    monitor.logger.isEnabledFor.return_value = False
+    monitor.log_debug("Hidden message")
+    monitor.logger.debug.assert_called_with("Debug message")
+
 
 def test_track_processing():
     """Test the processing tracking functionality."""
     monitor = PipelineMonitor()
 
     # Simulate processing that takes 0.1 seconds
-    start_time = time.time() - 0.1
-    monitor.track_processing(start_time)
+    start_ns = monitor.now_ns() - 100_000_000
+    monitor.track_processing(start_ns)
 
     # Check metrics
     assert monitor.metrics["throughput"] == 1
     assert len(monitor.metrics["latency"]) == 1
-    assert 0.09 <= monitor.metrics["latency"][0] <= 0.2  # Allow for slight timing variations
+    assert 90_000_000 <= monitor.metrics["latency"][0] <= 200_000_000  # Allow for slight timing variations
+    assert monitor._latency_count == 1
+    assert monitor._latency_sum_ns == monitor.metrics["latency"][0]
+
+
+def test_latency_window_is_bounded():
+    """Test that only the most recent latencies are kept while the average covers all of them."""
+    monitor = PipelineMonitor()
+
+    for _ in range(PipelineMonitor.LATENCY_WINDOW_SIZE + 10):
+        monitor.track_processing(monitor.now_ns())
+
+    assert len(monitor.metrics["latency"]) == PipelineMonitor.LATENCY_WINDOW_SIZE
+    assert monitor._latency_count == PipelineMonitor.LATENCY_WINDOW_SIZE + 10
 
 
 def test_get_metrics():
@@ -62,7 +86,8 @@ def test_get_metrics():
 
     # Add some test data
     monitor.metrics["throughput"] = 5
-    monitor.metrics["latency"] = [0.1, 0.2, 0.3, 0.4, 0.5]
+    monitor._latency_sum_ns = 1_500_000_000  # Latencies of 0.1, 0.2, 0.3, 0.4 and 0.5 seconds
+    monitor._latency_count = 5
     monitor.metrics["errors"] = 2
 
     # Get metrics
@@ -72,3 +97,15 @@ def test_get_metrics():
     assert metrics["throughput"] == 5
     assert metrics["avg_latency"] == 0.3  # Average of latency values
     assert metrics["errors"] == 2
+
+
+def test_null_monitor():
+    """Test that NullMonitor discards logging and latency without configuring handlers, but counts items."""
+    with patch('logging.FileHandler') as mock_file_handler:
+        monitor = NullMonitor()
+    mock_file_handler.assert_not_called()
+
+    monitor.log_error("Test error")
+    monitor.track_processing(monitor.now_ns())
+    assert not monitor.is_debug_enabled()
+    assert monitor.get_metrics() == {"throughput": 1, "avg_latency": 0, "errors": 0}
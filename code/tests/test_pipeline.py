@@ -1,6 +1,6 @@
 import pytest
 import asyncio
-from asyncdatapipeline.pipeline import AsyncDataPipeline, PipelineConfig
+from asyncdatapipeline.pipeline import AsyncDataPipeline, PipelineConfig, install_uvloop
 from asyncdatapipeline.monitoring import PipelineMonitor
 from asyncdatapipeline.transformers import uppercase_transformer
 
@@ -19,4 +19,77 @@ async def test_pipeline():
         config=PipelineConfig(max_concurrent_tasks=1)
     )
     await pipeline.run()
-    assert pipeline.monitor.metrics["throughput"] == 1
\ No newline at end of file
+    assert pipeline.monitor.metrics["throughput"] == 1
+
+@pytest.mark.asyncio
+async def test_pipeline_batched(tmp_path):
+    async def mock_source():
+        for i in range(5):
+            yield f"tweet {i}"
+
+    class EvenFilter:
+        def __init__(self):
+            self.batches = []
+            self.closed = False
+
+        async def close(self):
+            self.closed = True
+
+        async def transform_batch(self, items):
+            self.batches.append(list(items))
+            return [None if int(item[-1]) % 2 else item.upper() for item in items]
+
+    class RecordingDestination:
+        def __init__(self):
+            self.batches = []
+
+        async def send_batch(self, items):
+            self.batches.append(list(items))
+
+    transformer = EvenFilter()
+    destination = RecordingDestination()
+    pipeline = AsyncDataPipeline(
+        sources=[mock_source],
+        transformers=[transformer],
+        destinations=[destination],
+        config=PipelineConfig(
+            batch_size=3, checkpoint_path=str(tmp_path / "state.json"), enable_recovery=False
+        ),
+    )
+    await pipeline.run()
+
+    assert transformer.batches == [["tweet 0", "tweet 1", "tweet 2"], ["tweet 3", "tweet 4"]]
+    assert destination.batches == [["TWEET 0", "TWEET 2"], ["TWEET 4"]]
+    assert pipeline.monitor.metrics["throughput"] == 5
+    assert transformer.closed
+
+
+@pytest.mark.asyncio
+async def test_pipeline_skips_checkpoint_after_failed_flush(tmp_path):
+    async def mock_source():
+        yield "tweet"
+
+    class FailingDestination:
+        async def __call__(self, data):
+            pass
+
+        async def flush(self):
+            raise OSError("disk full")
+
+    checkpoint_path = tmp_path / "state.json"
+    pipeline = AsyncDataPipeline(
+        sources=[mock_source],
+        transformers=[],
+        destinations=[FailingDestination()],
+        config=PipelineConfig(checkpoint_path=str(checkpoint_path), enable_recovery=False),
+    )
+    await pipeline.run()
+
+    assert pipeline.processed_ids
+    assert not checkpoint_path.exists()
+
+
+def test_install_uvloop_respects_config():
+    policy = asyncio.get_event_loop_policy()
+    assert install_uvloop(PipelineConfig(use_uvloop=False)) is False
+    assert asyncio.get_event_loop_policy() is policy
@@ -1,62 +1,30 @@
 import asyncio
-import os
-import tempfile
+import locale
+from datetime import datetime
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import aiofiles
 import json
 
-from asyncdatapipeline.monitoring import PipelineMonitor
+from asyncdatapipeline.monitoring import NullMonitor
 from asyncdatapipeline.sources.files.base import FileSource
 from asyncdatapipeline.sources.files.csv import CSVFileSource
+from asyncdatapipeline.sources.files.parquet import ParquetFileSource
 from asyncdatapipeline.sources.api import ApiSource
+from asyncdatapipeline.sources.twitter import _parse_created_at
 
 
 @pytest.fixture
 def monitor():
     """Create a monitor fixture for testing."""
-    monitor = PipelineMonitor()
-    # Override the logger to avoid file writes during tests
-    monitor.log_event = MagicMock()
-    monitor.log_error = MagicMock()
-    monitor.log_debug = MagicMock()
-    monitor.log_warning = MagicMock()
-    return monitor
-
-
-@pytest.fixture
-async def temp_text_file():
-    """Create a temporary test file with sample content."""
-    with tempfile.NamedTemporaryFile(mode='w+', delete=False) as f:
-        f.write("line 1\nline 2\nline 3\n")
-        file_path = f.name
-
-    yield file_path
-
-    # Clean up
-    os.unlink(file_path)
-
-
-@pytest.fixture
-async def temp_csv_file():
-    """Create a temporary CSV file with sample content."""
-    with tempfile.NamedTemporaryFile(mode='w+', delete=False) as f:
-        f.write("id,name,value\n")
-        f.write("1,item1,100\n")
-        f.write("2,item2,200\n")
-        f.write("3,item3,300\n")
-        file_path = f.name
-
-    yield file_path
-
-    # Clean up
-    os.unlink(file_path)
+    return NullMonitor()
 
 
 @pytest.mark.asyncio
-async def test_file_source_standard(monitor, temp_text_file):
+async def test_file_source_standard(monitor, shared_text_file):
     """Test the standard file source."""
-    source = FileSource(temp_text_file, monitor)
+    source = FileSource(shared_text_file, monitor)
 
     lines = []
     async for line in source.generate():
@@ -69,9 +37,9 @@ async def test_file_source_standard(monitor, temp_text_file):
 
 
 @pytest.mark.asyncio
-async def test_csv_file_source(monitor, temp_csv_file):
+async def test_csv_file_source(monitor, shared_csv_file):
     """Test the CSV file source."""
-    source = CSVFileSource(temp_csv_file, monitor, has_header=True)
+    source = CSVFileSource(shared_csv_file, monitor, has_header=True)
 
     rows = []
     async for row in source.generate():
@@ -84,11 +52,85 @@ async def test_csv_file_source(monitor, temp_csv_file):
 
 
 @pytest.mark.asyncio
-async def test_multipart_file_reading(monitor, temp_text_file):
+async def test_csv_file_source_streaming(monitor, tmp_path):
+    """Test that files larger than chunk_size stream through csv.reader in batches."""
+    file_path = tmp_path / "large.csv"
+    lines = ["id,text"] + [f"{i},row {i}" for i in range(2500)] + ['2500,"multi\nline, quoted"']
+    file_path.write_text("\n".join(lines) + "\n")
+
+    source = CSVFileSource(str(file_path), monitor, multipart_enabled=False, chunk_size=64)
+    rows = [row async for row in source.generate()]
+
+    assert source._header == ["id", "text"]
+    assert len(rows) == 2501
+    assert rows[1234] == ["1234", "row 1234"]
+    assert rows[-1] == ["2500", "multi\nline, quoted"]
+
+
+@pytest.mark.asyncio
+async def test_csv_file_source_arrow(monitor, shared_csv_file):
+    """Test the CSV file source with the Arrow reader."""
+    source = CSVFileSource(shared_csv_file, monitor, has_header=True, use_arrow=True)
+
+    rows = []
+    async for row in source.generate():
+        rows.append(row)
+
+    assert len(rows) == 3
+    assert rows[0] == {"id": 1, "name": "item1", "value": 100}
+    assert rows[2] == {"id": 3, "name": "item3", "value": 300}
+
+
+@pytest.fixture
+def parquet_file(tmp_path):
+    """Create a Parquet file with several row groups."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = tmp_path / "items.parquet"
+    table = pa.table({"id": list(range(25)), "name": [f"item{i}" for i in range(25)]})
+    pq.write_table(table, file_path, row_group_size=10)
+    return str(file_path)
+
+
+@pytest.mark.asyncio
+async def test_parquet_file_source_row_groups(monitor, parquet_file):
+    """Test the Parquet source reads every row once across row groups and batches."""
+    source = ParquetFileSource(parquet_file, monitor, batch_size=4)
+
+    rows = [row async for row in source.generate()]
+
+    assert [row["id"] for row in rows] == list(range(25))
+    assert rows[12] == {"id": 12, "name": "item12"}
+
+
+@pytest.mark.asyncio
+async def test_parquet_file_source_processes(monitor, parquet_file):
+    """Test decoding row groups concurrently in worker processes keeps file order."""
+    source = ParquetFileSource(parquet_file, monitor, batch_size=4, use_processes=True, max_workers=2)
+
+    rows = [row async for row in source.generate()]
+
+    assert [row["id"] for row in rows] == list(range(25))
+
+
+@pytest.mark.asyncio
+async def test_parquet_file_source_filters(monitor, parquet_file):
+    """Test Parquet filters on a column outside the projection."""
+    source = ParquetFileSource(
+        parquet_file, monitor, columns=["name"], filters=[("id", ">=", 20)]
+    )
+
+    rows = [row async for row in source.generate()]
+
+    assert rows == [{"name": f"item{i}"} for i in range(20, 25)]
+
+
+@pytest.mark.asyncio
+async def test_multipart_file_reading(monitor, shared_text_file):
     """Test multipart file reading with small chunk size."""
     # Set a very small chunk size to force multipart reading
     source = FileSource(
-        temp_text_file,
+        shared_text_file,
         monitor,
         multipart_enabled=True,
         chunk_size=10  # Very small chunk size
@@ -105,9 +147,21 @@ async def test_multipart_file_reading(monitor, temp_text_file):
 
 
 @pytest.mark.asyncio
-async def test_api_source():
+async def test_multipart_chunk_boundaries(counting_monitor, tmp_path):
+    """Test multipart reading keeps lines and multi-byte characters split across chunks intact."""
+    file_path = tmp_path / "boundaries.txt"
+    file_path.write_bytes("café au lait\r\n\nnaïve 😀\nlast line".encode("utf-8"))
+
+    source = FileSource(str(file_path), counting_monitor, chunk_size=3, max_parallel_reads=2)
+    lines = [line async for line in source.generate()]
+
+    assert lines == ["café au lait", "", "naïve 😀", "last line"]
+    assert counting_monitor.messages["warning"] == []
+
+
+@pytest.mark.asyncio
+async def test_api_source(monitor):
     """Test the API source with mocked HTTP responses."""
-    monitor = MagicMock()
 
     # Mock the _fetch_from_rest method to return a sequence of items
     with patch("asyncdatapipeline.sources.api.ApiSource._fetch_from_rest") as mock_fetch:
@@ -129,3 +183,34 @@ async def test_api_source():
         assert len(items) == 2
         assert items[0]["id"] == 1
         assert items[1]["id"] == 2
+
+
+def test_parse_created_at():
+    """Test that created_at parses like strptime with the C locale, and rejects other layouts."""
+    value = "Wed Oct 10 20:19:24 -0530 2018"
+    expected = datetime.strptime(value, "%a %b %d %H:%M:%S %z %Y")
+
+    assert _parse_created_at(value) == expected
+    assert _parse_created_at(value).utcoffset() == expected.utcoffset()
+    for invalid in ("Wed Okt 10 20:19:24 +0000 2018", "2018-10-10 20:19:24", "Wed Oct 10 20:19 +0000 2018"):
+        with pytest.raises(ValueError):
+            _parse_created_at(invalid)
+
+
+def test_parse_created_at_non_c_locale():
+    """Test that English created_at values parse under a non-English LC_TIME locale."""
+    previous = locale.setlocale(locale.LC_TIME)
+    for name in ("de_DE.UTF-8", "fr_FR.UTF-8", "es_ES.UTF-8"):
+        try:
+            locale.setlocale(locale.LC_TIME, name)
+            break
+        except locale.Error:
+            continue
+    else:
+        pytest.skip("no non-English locale is installed")
+    try:
+        parsed = _parse_created_at("Thu May 02 08:00:00 +0000 2024")
+    finally:
+        locale.setlocale(locale.LC_TIME, previous)
+
+    assert (parsed.month, parsed.day, parsed.hour) == (5, 2, 8)
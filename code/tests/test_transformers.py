@@ -1,27 +1,27 @@
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import pyarrow as pa
 from unittest.mock import MagicMock, patch
 from typing import Dict, Any
 
-from asyncdatapipeline.monitoring import PipelineMonitor
+from asyncdatapipeline.monitoring import NullMonitor
 from asyncdatapipeline.transformers.base import BaseTransformer
 from asyncdatapipeline.transformers import (
     uppercase_transformer,
     deduplication_transformer,
     csv_dict_transformer,
+    keyword_filter_transformer,
+    fused_transformer,
 )
 
 
 @pytest.fixture
 def monitor():
     """Create a monitor fixture for testing."""
-    monitor = PipelineMonitor()
-    # Override the logger to avoid file writes during tests
-    monitor.log_event = MagicMock()
-    monitor.log_error = MagicMock()
-    monitor.log_debug = MagicMock()
-    monitor.log_warning = MagicMock()
-    return monitor
+    return NullMonitor()
 
 
 @pytest.mark.asyncio
@@ -39,6 +39,28 @@ async def test_uppercase_transformer(monitor):
     assert result["text"] == "hello world"
     assert result["username"] == "testuser"  # Should not change
 
+    # Test with an Arrow string array
+    result = await transformer(pa.array(["hello", "wörld"]))
+    assert result.to_pylist() == ["HELLO", "WÖRLD"]
+
+    # Bytes are uppercased too; only their ASCII letters change
+    assert await transformer(b"hello") == b"HELLO"
+    assert await transformer("wörld".encode()) == "WöRLD".encode()
+
+
+@pytest.mark.asyncio
+async def test_uppercase_transformer_modes(monitor):
+    """Test the uppercase transformer specialized for a known record type."""
+    str_transformer = uppercase_transformer(monitor, mode="str")
+    assert await str_transformer.transform_batch(["hello", "wörld"]) == ["HELLO", "WÖRLD"]
+
+    dict_transformer = uppercase_transformer(monitor, mode="dict")
+    result = await dict_transformer({"text": "hello world", "username": "testuser"})
+    assert result == {"text": "HELLO WORLD", "username": "testuser"}
+
+    with pytest.raises(ValueError):
+        uppercase_transformer(monitor, mode="bytes")
+
 
 @pytest.mark.asyncio
 async def test_deduplication_transformer(monitor):
@@ -61,20 +83,144 @@ async def test_deduplication_transformer(monitor):
 
 
 @pytest.mark.asyncio
-async def test_transformer_error_handling(monitor):
+async def test_deduplication_transformer_keyless_dicts(monitor):
+    """Test the default backend on dicts keyed by their full 64-bit hash."""
+    records = [{"value": i, "name": f"item{i}"} for i in range(200)]
+
+    transformer = deduplication_transformer(monitor, capacity=1000, error_rate=0.01)
+    assert [await transformer(record) for record in records] == records
+    assert [await transformer(dict(record)) for record in records] == [None] * len(records)
+
+    batched = deduplication_transformer(monitor, capacity=1000, error_rate=0.01)
+    assert await batched.transform_batch(records) == records
+    assert await batched.transform_batch(records) == [None] * len(records)
+
+
+@pytest.mark.asyncio
+async def test_deduplication_transformer_unserializable_dicts(monitor):
+    """Test the default backend on dicts that orjson can't encode and are hashed field by field."""
+    records = [{"value": i, "tags": {f"tag{i}"}} for i in range(200)]
+
+    transformer = deduplication_transformer(monitor, capacity=1000, error_rate=0.01)
+    keys = [transformer._get_key(record) for record in records]
+    assert all(-(1 << 63) <= key < (1 << 63) for key in keys)
+    assert any(key < 0 for key in keys)
+
+    assert [await transformer(record) for record in records] == records
+    assert await transformer.transform_batch(records) == [None] * len(records)
+
+
+@pytest.mark.asyncio
+async def test_deduplication_transformer_single_hash(monitor):
+    """Test the bit-array deduplication backend with a single hash function."""
+    transformer = deduplication_transformer(monitor, capacity=100, error_rate=0.01, num_hashes=1)
+    assert transformer.bloom.hashes() == 1
+
+    data1 = {"id": "123", "text": "Hello world"}
+    assert await transformer(data1) == data1
+    assert await transformer(data1) is None
+
+    data2 = {"username": "user", "text": "Different item"}
+    assert await transformer(data2) == data2
+
+
+@pytest.mark.asyncio
+async def test_csv_dict_transformer(monitor):
+    """Test the CSV to dict transformer."""
+    transformer = csv_dict_transformer(monitor)
+
+    result = await transformer("2024-01-01 10:00:00,user,hello,2024-01-01,5,10\n")
+    assert result == {
+        "timestamp": "2024-01-01 10:00:00",
+        "username": "user",
+        "text": "hello",
+        "created_at": "2024-01-01",
+        "retweets": "5",
+        "likes": 10,
+    }
+
+    # Rows missing the likes column are rejected instead of raising IndexError
+    assert await transformer("2024-01-01 10:00:00,user,hello,2024-01-01,5") == {}
+
+    # Rows already parsed into dicts pass through
+    assert await transformer(result) is result
+
+
+@pytest.mark.asyncio
+async def test_transform_batch(monitor):
+    """Test batch transformation keeps input order and marks filtered items with None."""
+    upper = uppercase_transformer(monitor)
+    assert await upper.transform_batch(["a", "b", 1]) == ["A", "B", 1]
+
+    dedup = deduplication_transformer(monitor, capacity=100, error_rate=0.01)
+    items = [{"id": "1"}, {"id": "2"}, {"id": "1"}]
+    assert await dedup.transform_batch(items) == [{"id": "1"}, {"id": "2"}, None]
+
+    fused = fused_transformer(monitor, [dedup, lambda item: item["id"]])
+    assert await fused.transform_batch([{"id": "3"}, {"id": "2"}]) == ["3", None]
+
+
+@pytest.mark.asyncio
+async def test_deduplication_transformer_mmap(monitor, tmp_path):
+    """Test the memory-mapped deduplication backend persists seen keys across instances."""
+    pytest.importorskip("pybloomfilter")
+    filename = str(tmp_path / "dedup.bloom")
+    data = {"text": "Hello world", "likes": 1}
+
+    transformer = deduplication_transformer(monitor, capacity=100, error_rate=0.01, filename=filename)
+    assert await transformer(data) == data
+    assert await transformer(dict(reversed(list(data.items())))) is None
+
+    reopened = deduplication_transformer(monitor, capacity=100, error_rate=0.01, filename=filename)
+    assert await reopened(data) is None
+
+
+@pytest.mark.asyncio
+async def test_keyword_filter_transformer(monitor):
+    """Test the keyword filter transformer."""
+    transformer = keyword_filter_transformer(monitor, ["python", "asyncio"])
+
+    # Strings containing any keyword should pass through
+    assert await transformer("learning asyncio today") == "learning asyncio today"
+
+    # Dicts are matched on their text field
+    data = {"text": "I love python", "username": "testuser"}
+    assert await transformer(data) == data
+
+    # Data without any keyword should be filtered (return None)
+    assert await transformer({"text": "nothing relevant"}) is None
+
+
+@pytest.mark.asyncio
+async def test_fused_transformer(monitor):
+    """Test the fused transformer chain."""
+    transformer = fused_transformer(monitor, [
+        uppercase_transformer(monitor),
+        keyword_filter_transformer(monitor, ["PYTHON"]),
+    ])
+
+    # All transformers are applied in order
+    assert await transformer("i love python") == "I LOVE PYTHON"
+
+    # A filter in the chain drops the item
+    assert await transformer("i love rust") is None
+
+
+@pytest.mark.asyncio
+async def test_transformer_error_handling(counting_monitor):
     """Test error handling in transformers."""
     class ErrorTransformer(BaseTransformer):
         async def transform(self, data):
             raise ValueError("Test error")
 
-    transformer = ErrorTransformer(monitor)
+    transformer = ErrorTransformer(counting_monitor)
 
     # Error should be logged and re-raised
     with pytest.raises(ValueError):
         await transformer("test data")
 
     # Check that error was logged
-    monitor.log_error.assert_called_once()
+    assert counting_monitor.messages["error"] == ["Error in transformer ErrorTransformer: Test error"]
 
 
 @pytest.mark.asyncio
@@ -109,3 +255,96 @@ async def test_nsfw_transformer_mocked(mock_model_class, mock_tokenizer_class, m
         data = {"text": "This is unsafe content"}
         result = await transformer(data)
         assert result is None
+
+
+@pytest.mark.asyncio
+@patch("asyncdatapipeline.transformers.nsfw.AutoTokenizer")
+@patch("asyncdatapipeline.transformers.nsfw.AutoModelForSequenceClassification")
+async def test_nsfw_transformer_cache(mock_model_class, mock_tokenizer_class, monitor):
+    """Test that repeated texts are scored from the cache without running the model again."""
+    from asyncdatapipeline.transformers import nsfw_transformer
+
+    transformer = nsfw_transformer(monitor, threshold=0.7, cache_size=2)
+
+    with patch.object(transformer, "_infer_batch", return_value=[-3.0]) as mock_infer:
+        first = await transformer.detect_nsfw("Just a retweet")
+        second = await transformer.detect_nsfw("Just a retweet")
+        assert first == second
+        assert first["nsfw"] < 0.5
+        assert mock_infer.call_count == 1
+
+    # Closing stops the batching task and the inference thread
+    batch_task = transformer._batch_task
+    await transformer.close()
+    assert batch_task.cancelled()
+    assert transformer._infer_executor is None
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Single-thread executor that records the texts of each batch submitted to it."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.batches = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.batches.append(list(args[0]))
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.mark.asyncio
+@patch("asyncdatapipeline.transformers.nsfw.AutoTokenizer")
+@patch("asyncdatapipeline.transformers.nsfw.AutoModelForSequenceClassification")
+async def test_nsfw_transformer_continuous_batching(mock_model_class, mock_tokenizer_class, monitor):
+    """Test that a lone text is dispatched at once and texts queued during inference form the next batch."""
+    from asyncdatapipeline.transformers import nsfw_transformer
+
+    transformer = nsfw_transformer(monitor, cache_size=0)
+    executor = RecordingExecutor()
+    transformer._infer_executor = executor
+    release = threading.Event()
+
+    def infer(texts):
+        release.wait(5)
+        return [-3.0] * len(texts)
+
+    with patch.object(transformer, "_infer_batch", side_effect=infer):
+        first = asyncio.create_task(transformer.detect_nsfw("a"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # Dispatched without waiting for more texts to arrive
+        assert executor.batches == [["a"]]
+
+        rest = [asyncio.create_task(transformer.detect_nsfw(text)) for text in ("b", "c")]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, *rest)
+
+    assert executor.batches == [["a"], ["b", "c"]]
+    await transformer.close()
+
+
+@pytest.mark.asyncio
+@patch("asyncdatapipeline.transformers.nsfw.AutoTokenizer")
+@patch("asyncdatapipeline.transformers.nsfw.AutoModelForSequenceClassification")
+async def test_nsfw_transformer_close_in_flight(mock_model_class, mock_tokenizer_class, monitor):
+    """Test that closing during a forward pass cancels the callers of that batch instead of hanging."""
+    from asyncdatapipeline.transformers import nsfw_transformer
+
+    transformer = nsfw_transformer(monitor, cache_size=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def infer(texts):
+        started.set()
+        release.wait(5)
+        return [-3.0] * len(texts)
+
+    with patch.object(transformer, "_infer_batch", side_effect=infer):
+        caller = asyncio.create_task(transformer.detect_nsfw("in flight"))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        await transformer.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(caller, 1)
+        release.set()